@@ -1,12 +1,19 @@
 # Configuration file for the Sphinx documentation builder.
-# build with ``sphinx-build . _build`` (add ``-b linkcheck`` to check links)
+# build with ``sphinx-build -j auto -d _build/.doctrees . _build`` (add ``-b linkcheck`` to check links);
+# ``-j auto`` reads (and writes) source files in parallel across all available cores, and ``-d`` keeps
+# the pickled environment/doctrees at a stable location, which can be cached (e.g. on CI, keyed on the
+# hashes of ``docs/**/*.{rst,md,ipynb}`` and ``conf.py``) so that only changed sources are re-read
 
+import glob
 import os
 import sys
 
-from recommonmark.transform import AutoStructify
-# -- Path setup --------------------------------------------------------------
-sys.path.insert(0, os.path.abspath(".."))
+# set ``DOPED_FAST_DOCS=1`` for fast local builds, skipping the (re-)execution and rendering of notebooks
+# (ignored on ReadTheDocs, where the full docs are always built):
+FAST = os.environ.get("DOPED_FAST_DOCS") == "1" and not os.environ.get("READTHEDOCS")
+# set ``DOPED_SKIP_API=1`` to build only the narrative docs (no autodoc import of ``doped`` for the
+# ``doped.*`` API reference pages), e.g. with ``make fasthtml``:
+SKIP_API = os.environ.get("DOPED_SKIP_API") == "1" and not os.environ.get("READTHEDOCS")
 
 # -- Project information -----------------------------------------------------
 project = "doped"
@@ -25,21 +32,50 @@ extensions = [
     "sphinx.ext.autodoc", # for automatic documentation
     "sphinx.ext.coverage",
     "sphinx.ext.napoleon",
-    "sphinx.ext.mathjax",
-    "sphinx.ext.viewcode",
+    "sphinx.ext.imgmath",  # render math at build time, rather than client-side with MathJax
     "sphinx.ext.autosectionlabel",
-    "sphinx_click",
     "sphinx_design",
     "myst_nb",  # for jupyter notebooks
     "sphinx_copybutton",
 ]
+# highlighted module source pages are slow to generate, so only included for full builds (i.e. on
+# ReadTheDocs, or locally with ``DOPED_FULL_DOCS=1``):
+if os.environ.get("DOPED_FULL_DOCS") or os.environ.get("READTHEDOCS"):
+    extensions.append("sphinx.ext.viewcode")
+# only load ``sphinx_click`` (which imports ``click`` and the CLI modules) if a page uses it:
+_docs_dir = os.path.dirname(os.path.abspath(__file__))
+
+
+def _uses_click_directive(path):
+    with open(path, encoding="utf-8") as f:
+        return "click::" in f.read()
+
+
+if os.environ.get("DOPED_FULL_DOCS") or any(
+    _uses_click_directive(path) for path in glob.glob(os.path.join(_docs_dir, "**", "*.rst"), recursive=True)
+):
+    extensions.append("sphinx_click")
+if SKIP_API:
+    extensions = [ext for ext in extensions if ext not in {"sphinx.ext.autodoc", "sphinx.ext.viewcode"}]
+
+# -- Path setup --------------------------------------------------------------
+# only needed for autodoc to find the ``doped`` package:
+if "sphinx.ext.autodoc" in extensions:
+    sys.path.insert(0, os.path.abspath(".."))
+
+# embed build-time-rendered SVG equations in the HTML:
+imgmath_image_format = "svg"
+imgmath_embed = True
+imgmath_font_size = 14
 
 # Make sure the target is unique
 autosectionlabel_prefix_document = True
+autosectionlabel_maxdepth = 2  # only label document titles and top-level sections
 
 source_suffix = {
     ".rst": "restructuredtext",
     ".ipynb": "myst-nb",
+    ".md": "myst-nb",  # MyST (jupytext) markdown notebooks, for light tutorials
 }
 
 # Add any paths that contain templates here, relative to this directory.
@@ -48,12 +84,17 @@ templates_path = ["_templates"]
 # List of patterns, relative to source directory, that match files and
 # directories to ignore when looking for source files.
 # This pattern also affects html_static_path and html_extra_path.
-exclude_patterns = ["_build", "Thumbs.db", ".DS_Store"]
+exclude_patterns = ["_build", "Thumbs.db", ".DS_Store", "*_ToDo.md"]
+if FAST:
+    exclude_patterns.append("**/*.ipynb")
+if SKIP_API:
+    exclude_patterns.extend(["doped.rst", "doped.*.rst"])
 
 myst_enable_extensions = [
     "html_admonition",
     "html_image", # to parse html syntax to insert images
     "dollarmath", #"amsmath", # to parse Latex-style math
+    "substitution",  # for ``myst_substitutions``
 ]
 
 # -- Options for HTML output -------------------------------------------------
@@ -61,34 +102,20 @@ myst_enable_extensions = [
 # The theme to use for HTML and HTML Help pages.  See the documentation for
 # a list of builtin themes.
 #
-html_theme = "renku" # "sphinx_book_theme"
+html_theme = "furo"  # lighter per-page templating than "renku"/"sphinx_book_theme"
 
 # The name of an image file (relative to this directory) to place at the top
 # of the sidebar.
 html_logo = "doped_logo_inverted.png"
 html_title = "doped"
 
-# If true, SmartyPants will be used to convert quotes and dashes to
-# typographically correct entities.
-html_use_smartypants = True
-
 # If true, "Created using Sphinx" is shown in the HTML footer. Default is True.
 # html_show_sphinx = True
 
 html_theme_options = {
-    "repository_url": "https://github.com/SMTG-Bham/doped",
-    "github_repo": "https://github.com/SMTG-Bham/doped",  # renku
-    "github_button": True,
-    "github_user": "SMTG-Bham", # Username
-    "description": "Python package for setting up, parsing and analysing charged defect supercell calculations",
-    "repository_branch": "develop",
-    "path_to_docs": "docs",
-    "use_repository_button": True,
-    "home_page_in_toc": True,
-    "launch_buttons": {
-        "binderhub_url": "https://mybinder.org",
-        "colab_url": "https://colab.research.google.com",
-    },
+    "source_repository": "https://github.com/SMTG-Bham/doped",
+    "source_branch": "develop",
+    "source_directory": "docs/",
 }
 
 # Adding “Edit Source” links on your Sphinx theme
@@ -103,28 +130,39 @@ html_context = {
 # -- Options for intersphinx extension ---------------------------------------
 
 # Example configuration for intersphinx: refer to the Python standard library.
+# Pre-fetched inventories in ``_intersphinx/`` (see ``make intersphinx``) are used if present, to avoid
+# fetching (and re-parsing) the remote inventories on every fresh build:
+_intersphinx_dir = os.path.join(_docs_dir, "_intersphinx")
+
+
+def _inventory(name):
+    path = os.path.join(_intersphinx_dir, f"{name}.inv")
+    return (path, None) if os.path.exists(path) else None
+
+
 intersphinx_mapping = {
-    "python": ("https://docs.python.org/3.12", None),
-    "numpy": ("http://docs.scipy.org/doc/numpy/", None),
-    "pymatgen": ("http://pymatgen.org/", None),
-    "matplotlib": ("http://matplotlib.org", None),
+    "python": ("https://docs.python.org/3.12", _inventory("python")),
+    "numpy": ("https://numpy.org/doc/stable/", _inventory("numpy")),
+    "pymatgen": ("http://pymatgen.org/", _inventory("pymatgen")),
+    "matplotlib": ("http://matplotlib.org", _inventory("matplotlib")),
 }
 
 # -- Options for autodoc -----------------------------------------------------
 autoclass_content="both"
+# mock heavy third-party dependencies, so that they aren't imported (in every worker, with ``-j auto``)
+# when autodoc reads the ``doped`` modules:
+autodoc_mock_imports = ["pymatgen", "scipy", "matplotlib", "ase", "shakenbreak", "pandas", "tqdm"]
+# render type hints in the parameter descriptions, so mocked classes don't break signature rendering:
+autodoc_typehints = "description"
 
 # -- Options for nb extension -----------------------------------------------
 nb_execution_mode = "off"
 # nb_render_image_options = {"height": "300",}  # Reduce plots size
 #myst_render_markdown_format = "gfm"
-myst_heading_anchors = 2
+myst_heading_anchors = 1  # only H1 anchors, to limit slug generation & std domain size
 github_doc_root = "https://github.com/executablebooks/MyST-Parser/tree/master/docs/"
-def setup(app):
-    app.add_config_value("myst_parser_config", {
-            "url_resolver": lambda url: github_doc_root + url,
-            "auto_toc_tree_section": "Contents",
-            }, True)
-    app.add_transform(AutoStructify)
+myst_substitutions = {"github_doc_root": github_doc_root}
 
 # ignore non-consecutive level header warnings, and attempted image editing:
-suppress_warnings = ["myst.header", "mystnb.image"]
+# and warnings from autodoc about mocked objects (see ``autodoc_mock_imports``):
+suppress_warnings = ["myst.header", "mystnb.image", "autodoc.mocked_object"]
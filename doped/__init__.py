@@ -12,6 +12,7 @@ import inspect
 import logging
 import multiprocessing
 import warnings
+from collections.abc import Callable
 from importlib.metadata import PackageNotFoundError, version
 
 import vise.util.logger
@@ -102,7 +103,9 @@ def get_mp_context():
 
 
 @contextlib.contextmanager
-def pool_manager(processes: int | None = None):
+def pool_manager(
+    processes: int | None = None, initializer: Callable | None = None, initargs: tuple = ()
+):
     r"""
     Context manager for ``multiprocessing`` ``Pool``, to throw a clearer error
     message when ``RuntimeError``\s are raised ``multiprocessing`` within
@@ -116,6 +119,11 @@ def pool_manager(processes: int | None = None):
             Number of processes to use with ``Pool``. If ``None``,
             will use ``mp.cpu_count() - 1`` (i.e. one less than the
             number of available CPUs).
+        initializer (Callable | None):
+            Function to call (with ``initargs``) at the start of each worker
+            process, e.g. to pre-populate caches. Default is ``None``.
+        initargs (tuple):
+            Arguments to pass to ``initializer``. Default is ``()``.
 
     Yields:
         Pool:
@@ -124,7 +132,9 @@ def pool_manager(processes: int | None = None):
     pool = None
     try:
         mp = get_mp_context()  # https://github.com/python/cpython/pull/100229
-        pool = mp.Pool(processes or max(1, mp.cpu_count() - 1))
+        pool = mp.Pool(
+            processes or max(1, mp.cpu_count() - 1), initializer=initializer, initargs=initargs
+        )
         yield pool
     except RuntimeError as orig_exc:
         if "freeze_support()" in str(orig_exc):
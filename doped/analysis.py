@@ -8,24 +8,45 @@ calculations, with publication-quality outputs.
 """
 
 import contextlib
+import hashlib
+import json
+import logging
 import os
+import pickle
+import re
+import time
 import warnings
-from copy import deepcopy
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from importlib.metadata import PackageNotFoundError, version
+from itertools import chain
+from pathlib import Path
+from typing import Literal, Protocol
 
 import numpy as np
+import pandas as pd
 from monty.json import MontyDecoder
 from monty.serialization import dumpfn
 from pymatgen.analysis.defects import core
-from pymatgen.analysis.defects.finder import cosine_similarity, get_site_vecs
+from pymatgen.analysis.defects.finder import get_site_vecs
 from pymatgen.core.sites import PeriodicSite
 from pymatgen.core.structure import Composition, Structure
 from pymatgen.electronic_structure.dos import FermiDos
 from pymatgen.ext.matproj import MPRester
-from pymatgen.io.vasp.inputs import Poscar
+from pymatgen.io.vasp.inputs import Poscar, UnknownPotcarWarning
 from pymatgen.io.vasp.outputs import Procar, Vasprun
+from pymatgen.util.coord import pbc_shortest_vectors
 from pymatgen.util.typing import PathLike
 from tqdm import tqdm
 
+try:
+    import psutil
+
+    psutil_installed = True
+except ImportError:
+    psutil_installed = False
+
 from doped import _doped_obj_properties_methods, _ignore_pmg_warnings, get_mp_context, pool_manager
 from doped.core import Defect, DefectEntry, guess_and_set_oxi_states_with_timeout
 from doped.generation import (
@@ -35,7 +56,12 @@ from doped.generation import (
     sort_defect_entries,
 )
 from doped.thermodynamics import DefectThermodynamics
-from doped.utils.efficiency import StructureMatcher_scan_stol, _parse_site_species_str, get_voronoi_nodes
+from doped.utils.efficiency import (
+    StructureMatcher_scan_stol,
+    _structure_fingerprint,
+    _voronoi_nodes_cache,
+    get_voronoi_nodes,
+)
 from doped.utils.parsing import (
     _compare_incar_tags,
     _compare_kpoints,
@@ -48,8 +74,10 @@ from doped.utils.parsing import (
     _multiple_files_warning,
     _vasp_file_parsing_action_dict,
     check_atom_mapping_far_from_defect,
+    find_archived_fname,
     get_core_potentials_from_outcar,
     get_defect_type_site_idxs_and_unrelaxed_structure,
+    get_eigenvalue_band_properties,
     get_locpot,
     get_matching_site,
     get_procar,
@@ -58,14 +86,19 @@ from doped.utils.parsing import (
     total_charge_from_vasprun,
 )
 from doped.utils.plotting import format_defect_name
+from doped.utils.qehacks import PymatgenEspressoHacks
 from doped.utils.symmetry import (
     _frac_coords_sort_func,
+    _frac_coords_sort_order,
+    _primitive_structure_cache,
     get_equiv_frac_coords_in_primitive,
     get_orientational_degeneracy,
     get_primitive_structure,
     point_symmetry_from_defect_entry,
 )
 
+_logger = logging.getLogger(__name__)
+
 
 def _custom_formatwarning(
     message: Warning | str,
@@ -98,21 +131,19 @@ _aniso_dielectric_but_using_locpot_warning = (
 
 
 def _convert_dielectric_to_tensor(dielectric: float | np.ndarray | list) -> np.ndarray:
-    # check if dielectric in required 3x3 matrix format
-    if not isinstance(dielectric, float | int):
-        dielectric = np.array(dielectric)
-        if dielectric.shape == (3,):
-            dielectric = np.diag(dielectric)
-        elif dielectric.shape != (3, 3):
-            raise ValueError(
-                f"Dielectric constant must be a float/int or a 3x1 matrix or 3x3 matrix, "
-                f"got type {type(dielectric)} and shape {dielectric.shape}"
-            )
-
-    else:
-        dielectric = np.eye(3) * dielectric
+    # convert to required 3x3 (float64) matrix format:
+    dielectric_array = np.asarray(dielectric, dtype=np.float64)
+    if dielectric_array.size == 1:  # scalar
+        return np.eye(3) * dielectric_array.item()
+    if dielectric_array.shape == (3,):
+        return np.diag(dielectric_array)
+    if dielectric_array.shape != (3, 3):
+        raise ValueError(
+            f"Dielectric constant must be a float/int or a 3x1 matrix or 3x3 matrix, "
+            f"got type {type(dielectric)} and shape {dielectric_array.shape}"
+        )
 
-    return dielectric
+    return np.array(dielectric_array)  # copy, so the input is never modified via the output
 
 
 def _convert_anisotropic_dielectric_to_isotropic_harmonic_mean(
@@ -123,7 +154,10 @@ def _convert_anisotropic_dielectric_to_isotropic_harmonic_mean(
     dielectric constant using the harmonic mean (closest physically reasonable
     choice for finite-size charge corrections).
     """
-    return 3 / sum(1 / diagonal_elt for diagonal_elt in np.diag(aniso_dielectric))
+    return 3 / (1 / np.asarray(aniso_dielectric).diagonal()).sum()
+
+
+_possible_defect_name_regex = re.compile(r"[A-Za-z].*_[+-]?\d+$")
 
 
 def check_and_set_defect_entry_name(
@@ -154,10 +188,13 @@ def check_and_set_defect_entry_name(
         else f"{possible_defect_name}_{'+' if charge_state > 0 else ''}{charge_state}"
     )
 
-    with contextlib.suppress(Exception):  # check if defect name is recognised
-        formatted_defect_name = format_defect_name(
-            defect_name_w_charge_state, include_site_info_in_name=True
-        )  # tries without site_info if with site_info fails
+    # check if defect name is recognised; skipping the (slower, exception-raising) ``format_defect_name``
+    # parsing for names which cannot be recognised (e.g. empty/no element symbol before charge state):
+    if _possible_defect_name_regex.search(defect_name_w_charge_state):
+        with contextlib.suppress(Exception):
+            formatted_defect_name = format_defect_name(
+                defect_name_w_charge_state, include_site_info_in_name=True
+            )  # tries without site_info if with site_info fails
 
     # (re-)determine doped defect name and store in metadata, regardless of whether folder name is
     # recognised:
@@ -248,6 +285,10 @@ def defect_from_structures(
             ``pymatgen`` ``Structure`` object of the unrelaxed defect
             structure.
     """
+    # compute (and cache, on the ``Lattice`` object shared by all its sites) the inverse lattice matrix
+    # upfront, which is otherwise lazily computed by the first of many fractional/Cartesian conversions:
+    _ = bulk_supercell.lattice.inv_matrix
+
     try:  # Try automatic defect site detection -- this gives us the "unrelaxed" defect structure
         (
             defect_type,
@@ -303,19 +344,21 @@ def defect_from_structures(
         if defect_type == "interstitial":
             # get closest Voronoi site in bulk supercell to final interstitial site as this is likely
             # the _initial_ interstitial site
-            closest_node_frac_coords = min(
-                [site.frac_coords for site in get_voronoi_nodes(bulk_supercell)],
-                key=lambda node: defect_site.distance_and_image_from_frac_coords(node)[0],
-            )
+            # (exact periodic distances to all nodes at once):
+            node_frac_coords = np.array([site.frac_coords for site in get_voronoi_nodes(bulk_supercell)])
+            closest_node_frac_coords = node_frac_coords[
+                bulk_supercell.lattice.get_all_distances(node_frac_coords, defect_site.frac_coords)
+                .ravel()
+                .argmin()
+            ]
             guessed_initial_defect_structure = unrelaxed_defect_structure.copy()
-            int_site = guessed_initial_defect_structure[defect_site_idx]
-            guessed_initial_defect_structure.remove_sites([defect_site_idx])
-            guessed_initial_defect_structure.insert(
-                defect_site_idx,  # Place defect at same position as in DFT calculation
-                int_site.species_string,
-                closest_node_frac_coords,
+            # replace in place (at same index as in DFT calculation), rather than removing & re-inserting
+            # (with an O(N^2) proximity check; not needed as Voronoi nodes are far from existing sites):
+            guessed_initial_defect_structure.replace(
+                defect_site_idx,
+                guessed_initial_defect_structure[defect_site_idx].species_string,
+                coords=closest_node_frac_coords,
                 coords_are_cartesian=False,
-                validate_proximity=True,
             )
             # if guessed initial site is sufficiently close to the relaxed site, then use it as
             # "defect_site_in_bulk", otherwise use the relaxed site:
@@ -343,23 +386,24 @@ def defect_from_structures(
             if k in ["symprec", "dist_tol_factor", "fixed_symprec_and_dist_tol_factor", "verbose"]
         },  # allowed kwargs for ``get_equiv_frac_coords_in_primitive``
     )
-    equiv_frac_coords_in_prim = sorted(equiv_frac_coords_in_prim, key=_frac_coords_sort_func)
-    equiv_defect_sites_in_prim = [
-        PeriodicSite(
-            defect_site_in_bulk.species,
-            frac_coords_in_prim,
-            primitive_structure.lattice,
-            coords_are_cartesian=False,
-        )
-        for frac_coords_in_prim in equiv_frac_coords_in_prim
+    # keep equivalent sites as a (K, 3) fractional coordinates array, only creating ``PeriodicSite``s
+    # once (for ``Defect`` initialisation) after any site-matching updates:
+    equiv_frac_coords_in_prim = np.asarray(equiv_frac_coords_in_prim)
+    equiv_frac_coords_in_prim = equiv_frac_coords_in_prim[
+        _frac_coords_sort_order(equiv_frac_coords_in_prim)
     ]
 
     if defect_type != "interstitial":  # ensure exact matches to Defect.structure (primitive) sites:
-        for defect_site_in_prim in equiv_defect_sites_in_prim:
-            bulk_site_in_prim = deepcopy(defect_site_in_prim)
-            bulk_site_in_prim.species = site_in_bulk.species
-            bulk_site_in_prim = get_matching_site(bulk_site_in_prim, primitive_structure)
-            defect_site_in_prim.frac_coords = bulk_site_in_prim.frac_coords
+        for i, frac_coords_in_prim in enumerate(equiv_frac_coords_in_prim):
+            equiv_frac_coords_in_prim[i] = get_matching_site(
+                PeriodicSite(
+                    site_in_bulk.species,
+                    frac_coords_in_prim,
+                    primitive_structure.lattice,
+                    coords_are_cartesian=False,
+                ),
+                primitive_structure,
+            ).frac_coords
 
         # also drop unsupported Defect() kwargs for non-interstitial defects:
         kwargs = {
@@ -368,6 +412,16 @@ def defect_from_structures(
             if k not in ["dist_tol_factor", "fixed_symprec_and_dist_tol_factor", "verbose"]
         }
 
+    equiv_defect_sites_in_prim = [
+        PeriodicSite(
+            defect_site_in_bulk.species,
+            frac_coords_in_prim,
+            primitive_structure.lattice,
+            coords_are_cartesian=False,
+        )
+        for frac_coords_in_prim in equiv_frac_coords_in_prim
+    ]
+
     for_monty_defect = {  # initialise doped Defect object, needs to use defect site in bulk (which for
         # substitutions differs from defect_site)
         "@module": "doped.core",
@@ -548,6 +602,81 @@ def defect_and_info_from_structures(
     )
 
 
+def defects_and_info_from_structures(
+    bulk_supercell: Structure,
+    defect_supercells: list[Structure],
+    processes: int | None = None,
+    **kwargs,
+) -> list[tuple[Defect, PeriodicSite, dict]]:
+    """
+    Generate the corresponding ``Defect`` objects, `relaxed` defect sites and
+    calculation metadata for a list of defect supercells sharing the same bulk
+    supercell, using ``defect_and_info_from_structures``.
+
+    Each defect supercell is independent, so these are parallelised over
+    multiple processes (with ``multiprocessing``) when ``processes`` is not 1.
+    The primitive structure (and Voronoi nodes, if any interstitials are
+    present) of the bulk supercell are computed once here, and used to seed
+    the caches of each worker process.
+
+    Args:
+        bulk_supercell (Structure):
+            Bulk supercell structure.
+        defect_supercells (list[Structure]):
+            List of defect structures to use for identifying the defect sites
+            and types.
+        processes (int | None):
+            Number of processes to use for multiprocessing. If not set
+            (default), uses one less than the number of available CPUs (or
+            1 if only one supercell is supplied). Set to 1 to disable
+            multiprocessing.
+        **kwargs:
+            Keyword arguments to pass to ``defect_and_info_from_structures``
+            (such as ``skip_atom_mapping_check``, ``symprec``, ``oxi_state``
+            etc).
+
+    Returns:
+        list[tuple[Defect, PeriodicSite, dict]]:
+            List of ``(defect, defect_site, defect_structure_metadata)``
+            tuples (see ``defect_and_info_from_structures``), in the same
+            order as ``defect_supercells``.
+    """
+    defect_and_info_func = partial(defect_and_info_from_structures, bulk_supercell, **kwargs)
+    if processes is None and len(defect_supercells) < 2:
+        processes = 1
+    if processes == 1:
+        return [defect_and_info_func(defect_supercell) for defect_supercell in defect_supercells]
+
+    # pre-compute bulk properties in the parent process, to seed the caches of the worker processes:
+    bulk_fingerprint = _structure_fingerprint(bulk_supercell)
+    get_primitive_structure(bulk_supercell, symprec=kwargs.get("symprec") or 0.01)
+    if any(len(defect_supercell) > len(bulk_supercell) for defect_supercell in defect_supercells):
+        get_voronoi_nodes(bulk_supercell)  # likely interstitials
+
+    voronoi_nodes_cache = {
+        key: value for key, value in _voronoi_nodes_cache.items() if key == bulk_fingerprint
+    }
+    primitive_structure_cache = {
+        key: value for key, value in _primitive_structure_cache.items() if key[0] == bulk_fingerprint
+    }
+
+    with pool_manager(
+        processes,
+        initializer=_seed_structure_caches,
+        initargs=(voronoi_nodes_cache, primitive_structure_cache),
+    ) as pool:
+        return list(pool.imap(defect_and_info_func, defect_supercells))
+
+
+def _seed_structure_caches(voronoi_nodes_cache: dict, primitive_structure_cache: dict):
+    """
+    Multiprocessing ``Pool`` initializer, to seed the Voronoi node and
+    primitive structure caches of worker processes with pre-computed entries.
+    """
+    _voronoi_nodes_cache.update(voronoi_nodes_cache)
+    _primitive_structure_cache.update(primitive_structure_cache)
+
+
 def guess_defect_position(defect_supercell: Structure) -> np.ndarray[float]:
     """
     Guess the position (in Cartesian coordinates) of a defect in an input
@@ -575,61 +704,83 @@ def guess_defect_position(defect_supercell: Structure) -> np.ndarray[float]:
     # Note from profiling: This function is pretty fast (e.g. ~25 s for ~1000 frames of a ~100-atom
     # supercell on SK's 2021 MacBook Pro), but the main bottleneck is SOAP vector creation,
     # if we ever needed to accelerate
-    def cos_dissimilarity(vec1, vec2):
-        return 1 - cosine_similarity(vec1, vec2)
 
     # if there is only one site of a particular element in the defect supercell, then we guess it as the
     # defect site (extrinsic substitution/interstitial):
-    i_elt_dict = {
-        i: _parse_site_species_str(site, wout_charge=True) for i, site in enumerate(defect_supercell.sites)
-    }
-    for elt in defect_supercell.composition.elements:
-        if list(i_elt_dict.values()).count(elt.symbol) == 1:
-            return defect_supercell.sites[list(i_elt_dict.values()).index(elt.symbol)].coords
-
-    soap_vecs = [site_vec.vec for site_vec in get_site_vecs(defect_supercell)]
-    elt_mean_soap_vec_dict = {
-        elt.symbol: np.mean(
-            [soap_vec for i, soap_vec in enumerate(soap_vecs) if i_elt_dict[i] == elt.symbol],
-            axis=0,
-        )
-        for elt in defect_supercell.composition.elements
-    }
-    cos_dissimilarities = [
-        cos_dissimilarity(soap_vecs[i], elt_mean_soap_vec_dict[i_elt]) for i, i_elt in i_elt_dict.items()
-    ]
-
-    rel_cos_dissimilarities = np.zeros(len(defect_supercell))
-    for elt in elt_mean_soap_vec_dict:
-        indices = [i for i, i_elt in i_elt_dict.items() if i_elt == elt]
-        avg_cos_dissimilarity = np.mean([cos_dissimilarities[i] for i in indices])
-        rel_cos_dissimilarities[indices] = np.array(cos_dissimilarities)[indices] / avg_cos_dissimilarity
-
-    largest_outlier = defect_supercell.sites[
-        np.where(rel_cos_dissimilarities == np.max(rel_cos_dissimilarities))[0][0]
-    ]
-    cos_diss_frac_coords_dict = {np.max(rel_cos_dissimilarities): largest_outlier.frac_coords}
-    for i, site in enumerate(defect_supercell.sites):
-        if not np.all(site.frac_coords == largest_outlier.frac_coords):
-            image = largest_outlier.distance_and_image(site)[1]
-            cos_diss_frac_coords_dict[rel_cos_dissimilarities[i]] = site.frac_coords + image
-
-    cos_diss_coords_dict = dict(
-        zip(
-            cos_diss_frac_coords_dict.keys(),
-            defect_supercell.lattice.get_cartesian_coords(
-                np.array(list(cos_diss_frac_coords_dict.values()))
-            ),
-            strict=False,
-        )
+    site_symbols = [site.specie.symbol for site in defect_supercell]
+    for symbol, count in Counter(site_symbols).items():
+        if count == 1:
+            return defect_supercell.cart_coords[site_symbols.index(symbol)]
+
+    soap_vecs = np.asarray([site_vec.vec for site_vec in get_site_vecs(defect_supercell)])
+    # vectorised cosine dissimilarities of each site SOAP vector to the mean SOAP vector of its element:
+    _, elt_ids = np.unique(site_symbols, return_inverse=True)
+    elt_counts = np.bincount(elt_ids)
+    elt_mean_soap_vecs = np.zeros((len(elt_counts), soap_vecs.shape[1]))
+    np.add.at(elt_mean_soap_vecs, elt_ids, soap_vecs)
+    site_mean_soap_vecs = (elt_mean_soap_vecs / elt_counts[:, None])[elt_ids]
+    cos_dissimilarities = 1 - np.einsum("ij,ij->i", soap_vecs, site_mean_soap_vecs) / (
+        np.linalg.norm(soap_vecs, axis=1) * np.linalg.norm(site_mean_soap_vecs, axis=1)
     )
+    avg_elt_cos_dissimilarities = np.bincount(elt_ids, weights=cos_dissimilarities) / elt_counts
+    rel_cos_dissimilarities = cos_dissimilarities / avg_elt_cos_dissimilarities[elt_ids]
+
+    largest_outlier = defect_supercell.sites[int(rel_cos_dissimilarities.argmax())]
+    # unwrap all sites to their (exact) minimum images relative to the largest outlier:
+    min_image_vecs = pbc_shortest_vectors(
+        defect_supercell.lattice, largest_outlier.frac_coords, defect_supercell.frac_coords
+    )[0]
     return np.average(  # weighted centre of mass
-        np.array(list(cos_diss_coords_dict.values())),
+        largest_outlier.coords + min_image_vecs,
         axis=0,
-        weights=np.array(list(cos_diss_coords_dict.keys())) ** 2,
+        weights=rel_cos_dissimilarities**2,
     )
 
 
+def guess_defect_positions(
+    defect_supercells: list[Structure],
+    processes: int | None = None,
+) -> list[np.ndarray[float]]:
+    """
+    Guess the positions (in Cartesian coordinates) of defects in a list of
+    input defect supercells (e.g. frames of an MD trajectory), without a
+    bulk/reference supercell, using ``guess_defect_position``.
+
+    Each supercell is independent, so these are parallelised over multiple
+    processes (with ``multiprocessing``) when ``processes`` is not 1.
+
+    Args:
+        defect_supercells (list[Structure]):
+            List of defect supercell structures.
+        processes (int | None):
+            Number of processes to use for multiprocessing. If not set
+            (default), uses one less than the number of available CPUs (or
+            1 if only one supercell is supplied). Set to 1 to disable
+            multiprocessing.
+
+    Returns:
+        list[np.ndarray[float]]:
+            Guessed positions of the defects in **Cartesian** coordinates, in
+            the same order as ``defect_supercells``.
+    """
+    if processes is None and len(defect_supercells) < 2:
+        processes = 1
+    if processes == 1:
+        return [
+            guess_defect_position(defect_supercell)
+            for defect_supercell in tqdm(defect_supercells, desc="Guessing defect positions")
+        ]
+
+    with pool_manager(processes) as pool:
+        return list(
+            tqdm(
+                pool.imap(guess_defect_position, defect_supercells),
+                total=len(defect_supercells),
+                desc="Guessing defect positions",
+            )
+        )
+
+
 def defect_name_from_structures(bulk_supercell: Structure, defect_supercell: Structure, **kwargs) -> str:
     """
     Get the doped/SnB defect name using the bulk and defect structures.
@@ -658,7 +809,25 @@ def defect_name_from_structures(bulk_supercell: Structure, defect_supercell: Str
     # note that if the symm_op approach fails for any reason here, the defect-supercell expansion
     # approach will only be valid if the defect structure is a diagonal expansion of the primitive...
 
-    return get_defect_name_from_defect(defect)
+    # the same defect (in different charge states, or with different relaxations) is typically named
+    # multiple times when parsing, so cache names to avoid repeating the (expensive) point symmetry
+    # determination:
+    cache_key = (
+        _structure_fingerprint(defect.structure),
+        type(defect).__name__,
+        defect.site.species_string,
+        np.round(defect.site.frac_coords, 8).tobytes(),
+    )
+    if cache_key not in _defect_name_cache:
+        if len(_defect_name_cache) >= 1024:  # limit cache size, dropping the oldest entry
+            _defect_name_cache.pop(next(iter(_defect_name_cache)))
+        _defect_name_cache[cache_key] = get_defect_name_from_defect(defect)
+
+    return _defect_name_cache[cache_key]
+
+
+# cleared with ``_defect_name_cache.clear()``, e.g. in long-running processes:
+_defect_name_cache: dict[tuple, str] = {}
 
 
 def defect_entry_from_paths(
@@ -764,22 +933,104 @@ def defect_entry_from_paths(
     return dp.defect_entry
 
 
-# -----------BASE CLASSES & FRONT END------------
+def defect_entries_from_paths(
+    defect_paths: list[PathLike],
+    bulk_path: PathLike,
+    dielectric: float | np.ndarray | list | None = None,
+    skip_corrections: bool = False,
+    error_tolerance: float = 0.05,
+    bulk_band_gap_vr: PathLike | Vasprun | None = None,
+    **kwargs,
+) -> list[DefectEntry]:
+    """
+    Parse the defect calculation outputs in each of ``defect_paths`` (with
+    ``defect_entry_from_paths``), sharing the same bulk supercell calculation,
+    and return the parsed ``DefectEntry`` objects.
+
+    The bulk supercell outputs (``vasprun.xml(.gz)``, and the ``LOCPOT`` /
+    ``OUTCAR`` data for charge corrections) are only parsed once, and then
+    reused for each defect, rather than being re-parsed in every
+    ``defect_entry_from_paths`` call. For parsing many defect calculations
+    (with multiprocessing, and duplicate/warnings handling), see
+    ``DefectsParser``.
+
+    Args:
+        defect_paths (list[PathLike]):
+            Paths to defect supercell folders (each containing at least
+            ``vasprun.xml(.gz)``).
+        bulk_path (PathLike):
+            Path to bulk supercell folder (containing at least
+            ``vasprun.xml(.gz)``).
+        dielectric (float or int or 3x1 matrix or 3x3 matrix):
+            Total dielectric constant of the host compound, used for the
+            charge corrections (see ``defect_entry_from_paths``).
+        skip_corrections (bool):
+            Whether to skip the calculation and application of finite-size
+            charge corrections to the defect energies. Default is ``False``.
+        error_tolerance (float):
+            Error tolerance for the charge corrections (see
+            ``defect_entry_from_paths``). Default is 0.05 eV.
+        bulk_band_gap_vr (PathLike or Vasprun):
+            Path to a ``vasprun.xml(.gz)`` file, or a ``pymatgen`` ``Vasprun``
+            object, from which to determine the bulk band gap and band edge
+            positions (see ``defect_entry_from_paths``). If None (default),
+            uses the bulk supercell calculation.
+        **kwargs:
+            Keyword arguments to pass to ``defect_entry_from_paths`` (and thus
+            ``DefectParser()`` methods), such as ``parse_projected_eigen``,
+            ``oxi_state``, ``multiplicity`` etc (see its docstring).
 
-from typing import Literal
+    Returns:
+        list[DefectEntry]:
+            Parsed ``DefectEntry`` objects, in the same order as
+            ``defect_paths``.
+    """
+    bulk_vr_path, multiple = _get_output_files_and_check_if_multiple("vasprun.xml", bulk_path)
+    if multiple:
+        _multiple_files_warning("vasprun.xml", bulk_path, bulk_vr_path, dir_type="bulk")
+    bulk_vr, bulk_procar = _parse_vr_and_poss_procar(
+        bulk_vr_path,
+        parse_projected_eigen=kwargs.get("parse_projected_eigen"),
+        output_path=bulk_path,
+        label="bulk",
+        parse_procar=True,
+    )
+    kwargs["parse_projected_eigen"] = bulk_vr.projected_eigenvalues is not None or bulk_procar is not None
+    bulk_corrections_data = {  # loaded by the first (charged) defect parsed, then reused
+        k: kwargs.pop(k, None) for k in ["bulk_locpot_dict", "bulk_site_potentials"]
+    }
+
+    defect_entries = []
+    for defect_path in defect_paths:
+        defect_entry = defect_entry_from_paths(
+            defect_path,
+            bulk_path,
+            dielectric=dielectric,
+            skip_corrections=skip_corrections,
+            error_tolerance=error_tolerance,
+            bulk_band_gap_vr=bulk_band_gap_vr,
+            bulk_vr=bulk_vr,
+            bulk_procar=bulk_procar,
+            **{k: v for k, v in bulk_corrections_data.items() if v is not None},
+            **kwargs,
+        )
+        for k, v in bulk_corrections_data.items():
+            if v is None:
+                bulk_corrections_data[k] = defect_entry.calculation_metadata.get(k)
+
+        defect_entries.append(defect_entry)
+
+    return defect_entries
+
+
+# -----------BASE CLASSES & FRONT END------------
 
 class DefectsParser:
     """
     This is the user-interface class that returns the relevant code class (DefectsParserVasp etc.)
     """
     def __new__(cls, code: Literal["vasp", "espresso"], **kwargs):
-        code = code.lower()
-        if code == "vasp":
-            return DefectsParserVasp(**kwargs)
-        elif code == "espresso":
-            return DefectsParserEspresso(**kwargs)
-        else:
-            raise ValueError(f"Unsupported code: {code}")
+        return _get_code_class(_DEFECTS_PARSERS, code)(**kwargs)
 
 
 class DefectParser:
@@ -787,48 +1038,312 @@ class DefectParser:
     This is the user-interface class that returns the relevant code class (DefectParserVasp etc.)
     """
     def __new__(cls, code: Literal["vasp", "espresso"], **kwargs):
-        code = code.lower()
-        if code == "vasp":
-            return DefectParserVasp#(**kwargs)
-        elif code == "espresso":
-            return DefectParserEspresso#(**kwargs)
-        else:
-            raise ValueError(f"Unsupported code: {code}")
+        return _get_code_class(_DEFECT_PARSERS, code)(**kwargs)
+
+    @classmethod
+    def from_paths(
+        cls, defect_path: PathLike, *args, code: Literal["vasp", "espresso"] = "vasp", **kwargs
+    ):
+        """
+        Parse the defect calculation at ``defect_path`` with the ``from_paths``
+        method of the relevant code class (``DefectParserVasp`` etc.).
+        """
+        return _get_code_class(_DEFECT_PARSERS, code).from_paths(defect_path, *args, **kwargs)
 
 
 class RunParser:
     def __new__(cls, code: Literal["vasp", "espresso"], **kwargs):
-        code = code.lower()
-        if code == "vasp":
-            return RunParserVasp #(**kwargs)
-        elif code == "espresso":
-            return RunParserEspresso #(**kwargs)
-        else:
-            raise ValueError(f"Unsupported code: {code}")
+        return _get_code_class(_RUN_PARSERS, code)(**kwargs)
 
 
+def _get_code_class(code_classes: dict[str, type], code: str) -> type:
+    try:
+        return code_classes[code.lower()]
+    except KeyError:
+        raise ValueError(f"Unsupported code: {code}") from None
 
-from abc import ABC, abstractmethod
 
-class BaseDefectsParser(ABC):
+class BaseDefectsParser(Protocol):
     """"
     The base implementation on which DefectsParserVasp and DefectsParserEspresso are actually to be implemented. 
+    (A structural ``Protocol``, so implementations do not need to subclass it.)
     """
-    @abstractmethod
     def parse_defects(self):
-        pass
+        ...
+
+
+def _parse_defects_in_pool(defects_parser, defect_folders: list[str], processes: int | None = None):
+    """
+    Parse ``defect_folders`` with ``defects_parser`` (``DefectsParserVasp``
+    etc.) over a multiprocessing pool, yielding the ``(defect_entry,
+    warnings_string, defect_folder)`` results of
+    ``_parse_defect_and_handle_warnings`` as they complete.
+
+    The parser (including the already-parsed bulk ``Vasprun``) is sent to each
+    worker process once, with the pool initializer, rather than being pickled
+    with every task. Folders are sent to the workers one at a time, as
+    parsing times vary widely between defects (so batching them would leave
+    workers idle at the end), and the per-task overhead is small.
+
+    If the generator is closed before all results are consumed (e.g. if an
+    error is raised while handling a result), the pool is terminated rather
+    than waiting for the remaining defects to be parsed.
+    """
+    with pool_manager(
+        processes, initializer=_set_worker_defects_parser, initargs=(defects_parser,)
+    ) as pool:
+        completed = False
+        try:
+            yield from pool.imap_unordered(_parse_defect_in_worker, defect_folders, chunksize=1)
+            completed = True
+        finally:
+            if not completed:  # consumer raised or stopped early, so don't wait for remaining tasks
+                pool.terminate()
+
+
+_worker_defects_parser = None  # set in each worker process by ``_set_worker_defects_parser``
+
+
+def _set_worker_defects_parser(defects_parser):
+    global _worker_defects_parser
+    _worker_defects_parser = defects_parser
+
+
+def _parse_defect_in_worker(defect_folder: str) -> tuple:
+    return _worker_defects_parser._parse_defect_and_handle_warnings(defect_folder)
+
 
-class BaseDefectParser(ABC):
+
+class BaseDefectParser(Protocol):
     """"
     The base implementation on which DefectParserVasp and DefectParserEspresso are actually to be implemented. 
     """
-    @abstractmethod
     def parse_defects(self):
-        pass
+        ...
 #============================================
 
 
 
+def _is_vasprun_file(filename: str) -> bool:
+    """
+    Check if ``filename`` is a ``vasprun.xml`` file, including compressed
+    and suffixed names (e.g. ``vasprun.xml.gz``, ``vasprun_relax.xml``).
+    """
+    return "vasprun" in filename.lower() and ".xml" in filename.lower() and not filename.startswith(".")
+
+
+def _is_likely_charged_defect_folder(defect_folder: str) -> bool:
+    """
+    Check if ``defect_folder`` likely corresponds to a charged defect (i.e.
+    the folder name ends with a non-zero charge state), without needing to
+    parse the calculation.
+    """
+    return defect_folder[-1] in "123456789"
+
+
+def _is_neutral_defect_folder(defect_folder: str) -> bool:
+    """
+    Check if ``defect_folder`` is known to correspond to a neutral defect
+    (i.e. the folder name ends with ``_0``), without needing to parse the
+    calculation.
+    """
+    return defect_folder.endswith("_0")
+
+
+# parsing warnings which are collectively warned later in ``DefectsParser``:
+_IGNORED_PARSING_WARNING_PREFIXES = (
+    "Estimated error",
+    "There are mismatching",
+    "The KPOINTS",
+    "The POTCAR",
+)
+
+
+# ``_multiple_files_warning`` message, e.g. "Multiple `OUTCAR` files found in defect directory: {dir}.
+# Using {filename} to ...":
+_MULTIPLE_FILES_WARNING_REGEX = re.compile(
+    r"Multiple `(?P<file_type>[^`]*)`.*?directory: (?P<directory>.*?)\. Using (?P<chosen_file>.*?) to",
+    re.DOTALL,
+)
+
+
+def _split_failed_parsing_warning(warning: str) -> tuple[str, str]:
+    """
+    Get the defect name and error from a "Parsing failed for {defect}, got
+    error: {error}" warning message, with ``str.partition``.
+    """
+    defect_name, _, rest = warning.partition("Parsing failed for ")[2].partition(", got ")
+    return defect_name, rest.partition("error: ")[2]
+
+
+def _is_ignored_parsing_warning(warning_message: Warning | str) -> bool:
+    """
+    Check if a warning caught during defect parsing is one which is
+    collectively warned later in ``DefectsParser`` (i.e. starts with one of
+    ``_IGNORED_PARSING_WARNING_PREFIXES``).
+    """
+    if hasattr(warning_message, "args"):
+        warning_message = warning_message.args[0]
+    return warning_message.startswith(_IGNORED_PARSING_WARNING_PREFIXES)
+
+
+def _set_parsing_pbar_description(
+    pbar: tqdm, defect_folder: str, subfolder: str, min_interval: float = 0.5, force: bool = False
+):
+    """
+    Set the description of the parsing progress bar to the defect folder being
+    parsed, at most once every ``min_interval`` seconds (unless ``force`` is
+    ``True``), to avoid reformatting and redrawing the progress bar for every
+    folder when parsing many defects.
+    """
+    now = time.monotonic()
+    if force or now - getattr(pbar, "_doped_last_desc_time", -min_interval) >= min_interval:
+        pbar.set_description(
+            f"Parsing {defect_folder if subfolder == '.' else f'{defect_folder}/{subfolder}'}"
+        )
+        pbar._doped_last_desc_time = now
+
+
+# rough estimates used to limit the number of parsing processes by the available memory:
+# ``gzip`` typically compresses ``vasprun.xml`` files by ~4-6x:
+_GZIP_COMPRESSION_RATIO_ESTIMATE = 5
+# ``pymatgen`` parses ``vasprun.xml`` files incrementally (``iterparse``, clearing elements once read),
+# so peak memory is dominated by the parsed data (eigenvalues, projections etc.), typically at most
+# ~2x the uncompressed file size:
+_VASPRUN_PARSING_MEMORY_FACTOR = 2
+
+
+def _get_memory_limited_processes(processes: int, vr_path: PathLike) -> int:
+    """
+    Limit the number of ``processes`` to use for parsing defect calculations,
+    based on the available memory (if ``psutil`` is installed), to avoid
+    swapping / out-of-memory errors which can stall multiprocessing.
+
+    The bulk ``vasprun.xml(.gz)`` size is used as a proxy for the size of the
+    defect ``vasprun.xml(.gz)`` files (same supercell), with parsing taking
+    roughly ``_VASPRUN_PARSING_MEMORY_FACTOR`` times the (uncompressed) file
+    size in memory.
+    """
+    if not psutil_installed:
+        return processes
+    try:
+        vr_size = os.path.getsize(vr_path)
+        available_memory = psutil.virtual_memory().available
+    except OSError:
+        return processes
+
+    if str(vr_path).endswith(".gz"):
+        vr_size *= _GZIP_COMPRESSION_RATIO_ESTIMATE
+    memory_limited_processes = max(
+        1, min(processes, available_memory // max(1, vr_size * _VASPRUN_PARSING_MEMORY_FACTOR))
+    )
+    if memory_limited_processes < processes:
+        _logger.info(
+            f"Using {memory_limited_processes} (rather than {processes}) parsing processes, as the "
+            f"available memory ({available_memory / 1e9:.1f} GB) is likely insufficient to parse more "
+            f"vasprun.xml files in parallel. Set `processes` to override this."
+        )
+
+    return memory_limited_processes
+
+
+def _sort_by_vasprun_size(
+    defect_folders: list[str], output_path: PathLike, subfolder: str, folder_scans: dict | None = None
+) -> list[str]:
+    """
+    Sort ``defect_folders`` by the size of their ``vasprun.xml(.gz)`` files,
+    largest first, so that the slowest calculations to parse are dispatched
+    first when multiprocessing, and workers aren't left idle waiting on a
+    large calculation at the end (i.e. longest-processing-time-first
+    scheduling).
+
+    Args:
+        defect_folders (list[str]):
+            Defect folder names (in ``output_path``) to sort.
+        output_path (PathLike):
+            Path to the folder containing the defect folders.
+        subfolder (str):
+            Subfolder of each defect folder containing the calculation.
+        folder_scans (dict):
+            Folder scans from ``_scan_subfolders(output_path)``, to reuse the
+            file listings of the defect folders, if available.
+
+    Returns:
+        list[str]: The sorted defect folder names.
+    """
+    folder_scans = folder_scans or {}
+
+    def _vasprun_size(defect_folder):
+        files = None
+        if folder_scan := folder_scans.get(defect_folder):
+            files = folder_scan["files"] if subfolder == "." else folder_scan["subdirs"].get(subfolder)
+        try:
+            vr_path, _multiple = _get_output_files_and_check_if_multiple(
+                "vasprun.xml", os.path.join(output_path, defect_folder, subfolder), files=files
+            )
+            return os.path.getsize(vr_path)
+        except OSError:
+            return 0
+
+    return sorted(defect_folders, key=_vasprun_size, reverse=True)
+
+
+def _scan_folder(path: PathLike) -> dict:
+    """
+    List the files and subfolders of ``path`` (and the files in each
+    subfolder) with one ``os.scandir`` pass per directory, so that the
+    various folder checks in ``DefectsParser`` can reuse the listing rather
+    than calling ``os.listdir``/``os.walk`` repeatedly.
+
+    Args:
+        path (PathLike): Path to the folder to scan.
+
+    Returns:
+        dict:
+            ``{"files": set of filenames in ``path``, "subdirs": {subfolder
+            name: set of filenames in subfolder}, "has_vasprun": bool}``,
+            where ``has_vasprun`` is whether a ``vasprun.xml(.gz)`` file is
+            present in ``path`` or its subfolders (i.e. the expected
+            ``defect_folder/[subfolder/]vasprun.xml(.gz)`` layout; deeper
+            folders, such as saved analysis outputs, are not searched).
+    """
+    files, subdirs = set(), {}
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                with os.scandir(entry.path) as sub_entries:
+                    subdirs[entry.name] = {
+                        sub_entry.name for sub_entry in sub_entries if sub_entry.is_file()
+                    }
+            else:
+                files.add(entry.name)
+
+    has_vasprun = any(
+        _is_vasprun_file(file) for file_set in [files, *subdirs.values()] for file in file_set
+    )
+
+    return {"files": files, "subdirs": subdirs, "has_vasprun": has_vasprun}
+
+
+def _scan_subfolders(path: PathLike) -> dict[str, dict]:
+    """
+    Scan each subfolder of ``path`` with ``_scan_folder``, returning a dict
+    of ``{subfolder name: _scan_folder output}`` (in directory order).
+
+    If there are many subfolders, these are scanned in a thread pool, as
+    the scans are I/O-bound (particularly on network filesystems).
+    """
+    with os.scandir(path) as entries:
+        subfolder_paths = {entry.name: entry.path for entry in entries if entry.is_dir()}
+
+    if len(subfolder_paths) > 8:  # otherwise not worth the thread startup cost
+        with ThreadPoolExecutor(max_workers=min(32, len(subfolder_paths))) as executor:
+            scans = executor.map(_scan_folder, subfolder_paths.values())
+            return dict(zip(subfolder_paths, scans, strict=True))
+
+    return {name: _scan_folder(subfolder_path) for name, subfolder_path in subfolder_paths.items()}
+
+
 class DefectsParserVasp:
     def __init__(
         self,
@@ -842,6 +1357,7 @@ class DefectsParserVasp:
         processes: int | None = None,
         json_filename: PathLike | bool | None = None,
         parse_projected_eigen: bool | None = None,
+        cache: bool = False,
         **kwargs,
     ):
         r"""
@@ -947,7 +1463,8 @@ class DefectsParserVasp:
             processes (int):
                 Number of processes to use for multiprocessing for expedited
                 parsing. If not set, defaults to one less than the number of
-                CPUs available. Set to 1 for no multiprocessing.
+                CPUs available (limited by the available memory, if ``psutil``
+                is installed). Set to 1 for no multiprocessing.
             json_filename (PathLike):
                 Filename to save the parsed defect entries dict
                 (``DefectsParser.defect_dict``) to in ``output_path``, to avoid
@@ -972,6 +1489,15 @@ class DefectsParserVasp:
                 Default is ``None``, which will attempt to load this data but
                 with no warning if it fails (otherwise if ``True`` a warning
                 will be printed).
+            cache (bool):
+                Whether to save each parsed ``DefectEntry`` (and its parsing
+                warnings) to a ``.doped_cache`` folder in ``output_path``, and
+                reuse these when re-parsing, if none of the files in the defect
+                and bulk folders or the parsing settings have changed (e.g. when
+                re-running after adding new defect calculations). Cached entries
+                are stored with ``pickle``, so should only be used with trusted
+                ``output_path`` directories.
+                Default is ``False``.
             **kwargs:
                 Keyword arguments to pass to ``DefectParser()`` methods
                 (``load_FNV_data()``, ``load_eFNV_data()``,
@@ -1006,13 +1532,12 @@ class DefectsParserVasp:
         self.error_tolerance = error_tolerance
         self.bulk_path = bulk_path
         self.subfolder = subfolder
-        if bulk_band_gap_vr and not isinstance(bulk_band_gap_vr, Vasprun):
-            self.bulk_band_gap_vr = get_vasprun(bulk_band_gap_vr, parse_projected_eigen=False)
-        else:
-            self.bulk_band_gap_vr = bulk_band_gap_vr
+        self.bulk_band_gap_vr = bulk_band_gap_vr  # parsed after the bulk supercell calculation
         self.processes = processes
         self.json_filename = json_filename
         self.parse_projected_eigen = parse_projected_eigen
+        self.cache = cache
+        self._bulk_files_key = None  # determined on first cache lookup
         self.bulk_vr = None  # loaded later
         self.kwargs = kwargs
 
@@ -1032,48 +1557,22 @@ class DefectsParserVasp:
         #       if you find 'vasprun' and 'xml' in a file
                     # add it to your list of possible defect folders.
         
-        def _find_possible_defect_folders(inside = self.output_path, contains = "vasprun", ext = ".xml"):
+        # list the contents of each folder in output_path once, and reuse for all folder checks below:
+        folder_scans = _scan_subfolders(self.output_path)
+
+        def _find_possible_defect_folders(folder_scans):
             """
-            Find folders in `inside` containing `contains` and having extension `xml`
-            Args:
-                inside: folder to walk through
-                contains: text in filename.
-                ext: file extension.
+            Find folders containing ``vasprun.xml(.gz)`` files (in the folder
+            itself or subfolders), from the ``_scan_subfolders`` output.
 
             Returns:
-                List of folders meeting criteria of having both `contains` and `xml` in filename.
+                List of folders containing ``vasprun.xml(.gz)`` files.
             """
-                
-            possible_defect_folders = []
-
-            for dir in os.listdir(self.output_path):
-                dir_path = os.path.join(self.output_path, dir) #search each directory
-                if not os.path.isdir(dir_path):
-                    continue  # skip if it's not a directory
-
-                found = False  # Flag to indicate a matching file was found
-
-                for root, _, files in os.walk(dir_path):
-                    for file in files:
-                        if contains in file and ext in file:
-                            found = True
-                            break  # Stop checking files
-                    if found:
-                        break  # Stop walking deeper
-
-                if found:
-                    possible_defect_folders.append(dir)
-
-            return possible_defect_folders
+            return [dir for dir, folder_scan in folder_scans.items() if folder_scan["has_vasprun"]]
 
-        possible_defect_folders = _find_possible_defect_folders(inside = self.output_path,
-                                                                contains = "vasprun", 
-                                                                ext = ".xml")
+        possible_defect_folders = _find_possible_defect_folders(folder_scans)
 
-        def find_possible_defect_folders_dynamic(output_path, bulk_path=None, 
-                                                 contains = 'vasprun',
-                                                 ext = '.xml',
-                                                 update_output_path=False):
+        def find_possible_defect_folders_dynamic(output_path, bulk_path=None, update_output_path=False):
             """
             Search for possible defect or bulk folders in the parent of `output_path`.
 
@@ -1083,39 +1582,34 @@ class DefectsParserVasp:
                 update_output_path (bool): If True and matches found, returns updated output_path.
 
             Returns:
-                tuple: (possible_defect_folders: list of str, output_path: str)
+                tuple: (possible_defect_folders: list of str, output_path: str, folder_scans: dict)
             """
             parent_dir = os.path.join(output_path, os.pardir)
-            possible_defect_folders = []
-
-            for dir in os.listdir(parent_dir):
-                full_dir_path = os.path.join(parent_dir, dir)
-
-                for root, _, files in os.walk(full_dir_path):
-                    for file in files:
-                        if contains in file and ext in file: #if `contains` and `ext` are in filename (e.g. vasprun and .xml)
-                            if (                                        #see if
-                                os.path.basename(output_path) in dir    #the dir matches the current folder name 
-                                or "bulk" in dir.lower()                #or contains 'bulk' in its name (is bulk)
-                                or (bulk_path is not None and str(bulk_path).lower() in dir.lower())    #or matches a user defined bulk
-                            ):
-                                possible_defect_folders.append(dir)
-                                break
-                    else:
-                        continue
-                    break
+            parent_folder_scans = _scan_subfolders(parent_dir)
+            possible_defect_folders = [
+                dir
+                for dir in _find_possible_defect_folders(parent_folder_scans)
+                if (
+                    os.path.basename(output_path) in dir  # the dir matches the current folder name
+                    or "bulk" in dir.lower()  # or contains 'bulk' in its name (is bulk)
+                    or (bulk_path is not None and str(bulk_path).lower() in dir.lower())  # or user bulk
+                )
+            ]
 
             if update_output_path and possible_defect_folders:
                 output_path = parent_dir
 
-            return possible_defect_folders, output_path
+            return possible_defect_folders, output_path, parent_folder_scans
 
 
         if not possible_defect_folders:
-            possible_defect_folders, self.output_path = find_possible_defect_folders_dynamic(self.output_path, 
-                                                                                             self.bulk_path,
-                                                                                             contains = 'vasprun', ext = '.xml',
-                                                                                             update_output_path=True)
+            possible_defect_folders, self.output_path, parent_folder_scans = (
+                find_possible_defect_folders_dynamic(
+                    self.output_path, self.bulk_path, update_output_path=True
+                )
+            )
+            if possible_defect_folders:  # output_path updated to parent directory
+                folder_scans = parent_folder_scans
 
 #        if not possible_defect_folders:  # user may have specified the defect folder directly, so check
 #            # if we can dynamically determine the defect folder:
@@ -1142,33 +1636,32 @@ class DefectsParserVasp:
             vasp_subfolders = [
                 subdir
                 for possible_defect_folder in possible_defect_folders
-                for subdir in os.listdir(os.path.join(self.output_path, possible_defect_folder))
-                if os.path.isdir(os.path.join(self.output_path, possible_defect_folder, subdir))
-                and "vasp_" in subdir
+                for subdir in folder_scans[possible_defect_folder]["subdirs"]
+                if "vasp_" in subdir
             ]
-            vasp_type_count_dict = {  # Count Dik
-                i: len([subdir for subdir in vasp_subfolders if i in subdir])
-                for i in ["vasp_ncl", "vasp_std", "vasp_nkred_std", "vasp_gam"]
-            }
+            vasp_priority = ("vasp_ncl", "vasp_std", "vasp_nkred_std", "vasp_gam")
+            vasp_type_count_dict = Counter(  # single pass, each subfolder counted for its top type
+                next((vasp_type for vasp_type in vasp_priority if vasp_type in subdir), None)
+                for subdir in vasp_subfolders
+            )
             # take first entry with non-zero count, else use defect folder itself:
-            self.subfolder = next((subdir for subdir, count in vasp_type_count_dict.items() if count), ".")
+            self.subfolder = next((i for i in vasp_priority if vasp_type_count_dict[i]), ".")
         self.subfolder = str(self.subfolder)
-        possible_bulk_folders = [
-            dir
-            for dir in possible_defect_folders
-            if "bulk" in str(dir).lower()
-            or (self.bulk_path is not None and str(dir).lower() == str(self.bulk_path).lower())
-        ]
-
+        bulk_path_lower = str(self.bulk_path).lower() if self.bulk_path is not None else None
+        possible_bulk_folders = []
+        suffixed_bulk_folders = []  # folders ending with "_bulk"
+        for dir in possible_defect_folders:
+            dir_lower = str(dir).lower()
+            if "bulk" in dir_lower or dir_lower == bulk_path_lower:
+                possible_bulk_folders.append(dir)
+                if dir_lower.endswith("_bulk"):
+                    suffixed_bulk_folders.append(dir)
 
         if self.bulk_path is None:  # determine bulk_path to use
             if len(possible_bulk_folders) == 1:
                 self.bulk_path = os.path.join(self.output_path, possible_bulk_folders[0])
-            elif len([dir for dir in possible_bulk_folders if str(dir).lower().endswith("_bulk")]) == 1:
-                self.bulk_path = os.path.join(
-                    self.output_path,
-                    next(iter(dir for dir in possible_bulk_folders if str(dir).lower().endswith("_bulk"))),
-                )
+            elif len(suffixed_bulk_folders) == 1:
+                self.bulk_path = os.path.join(self.output_path, suffixed_bulk_folders[0])
             else:
                 raise ValueError(
                     f"Could not automatically determine bulk supercell calculation folder in "
@@ -1189,7 +1682,9 @@ class DefectsParserVasp:
             for dir in possible_defect_folders
             if dir not in possible_bulk_folders
             and (
-                self.subfolder in os.listdir(os.path.join(self.output_path, dir)) or self.subfolder == "."
+                self.subfolder in folder_scans[dir]["subdirs"]
+                or self.subfolder in folder_scans[dir]["files"]
+                or self.subfolder == "."
             )
         ]
 
@@ -1206,25 +1701,31 @@ class DefectsParserVasp:
 
 
 
-        if os.path.isdir(os.path.join(self.bulk_path, self.subfolder)) and any(
-            "vasprun" in file and ".xml" in file
-            for file in os.listdir(os.path.join(self.bulk_path, self.subfolder))
-        ):
+        # reuse the bulk folder scan if the bulk folder is in output_path, otherwise scan it now:
+        bulk_dir, bulk_dirname = os.path.split(str(self.bulk_path).rstrip(os.sep))
+        bulk_scan = (
+            folder_scans.get(bulk_dirname) if os.path.samefile(bulk_dir or ".", self.output_path) else None
+        ) or _scan_folder(self.bulk_path)
+        bulk_subfolder_files = (
+            bulk_scan["files"] if self.subfolder == "." else bulk_scan["subdirs"].get(self.subfolder)
+        )
+        if bulk_subfolder_files is None and os.path.isdir(os.path.join(self.bulk_path, self.subfolder)):
+            bulk_subfolder_files = os.listdir(os.path.join(self.bulk_path, self.subfolder))  # nested
+        bulk_path_files = bulk_scan["files"]  # files in the final bulk path, to avoid re-listing
+        if bulk_subfolder_files and any(_is_vasprun_file(file) for file in bulk_subfolder_files):
             self.bulk_path = os.path.join(self.bulk_path, self.subfolder)
-        elif all("vasprun" not in file or ".xml" not in file for file in os.listdir(self.bulk_path)):
+            bulk_path_files = bulk_subfolder_files
+        elif not any(_is_vasprun_file(file) for file in bulk_scan["files"]):
             possible_bulk_subfolders = [
                 dir
-                for dir in os.listdir(self.bulk_path)
-                if os.path.isdir(os.path.join(self.bulk_path, dir))
-                and any(
-                    "vasprun" in file and ".xml" in file
-                    for file in os.listdir(os.path.join(self.bulk_path, dir))
-                )
+                for dir, files in bulk_scan["subdirs"].items()
+                if any(_is_vasprun_file(file) for file in files)
             ]
             if len(possible_bulk_subfolders) == 1 and subfolder is None:
                 # if only one subfolder with a vasprun.xml file in it, and `subfolder` wasn't explicitly
                 # set by the user, then use this
                 self.bulk_path = os.path.join(self.bulk_path, possible_bulk_subfolders[0])
+                bulk_path_files = bulk_scan["subdirs"][possible_bulk_subfolders[0]]
             else:
                 raise FileNotFoundError(
                     f"`vasprun.xml(.gz)` files (needed for defect parsing) not found in bulk folder at: "
@@ -1234,7 +1735,9 @@ class DefectsParserVasp:
 
         # remove trailing '/.' from bulk_path if present:
         self.bulk_path = self.bulk_path.rstrip("/.")
-        bulk_vr_path, multiple = _get_output_files_and_check_if_multiple("vasprun.xml", self.bulk_path)
+        bulk_vr_path, multiple = _get_output_files_and_check_if_multiple(
+            "vasprun.xml", self.bulk_path, files=bulk_path_files
+        )
         if multiple:
             _multiple_files_warning(
                 "vasprun.xml",
@@ -1253,13 +1756,18 @@ class DefectsParserVasp:
         self.parse_projected_eigen = (
             self.bulk_vr.projected_eigenvalues is not None or self.bulk_procar is not None
         )
+        if self.bulk_band_gap_vr and not isinstance(self.bulk_band_gap_vr, Vasprun):
+            if _is_bulk_supercell_vasprun(self.bulk_band_gap_vr, self.bulk_path):
+                self.bulk_band_gap_vr = self.bulk_vr  # already parsed, no need to reparse
+            else:
+                self.bulk_band_gap_vr = get_vasprun(
+                    self.bulk_band_gap_vr, band_structure_only=True, parse_projected_eigen=False
+                )
 
         # try parsing the bulk oxidation states first, for later assigning defect "oxi_state"s (i.e.
         # fully ionised charge states):
         self._bulk_oxi_states: Structure | Composition | dict | bool = False
-        if bulk_struct_w_oxi := guess_and_set_oxi_states_with_timeout(
-            self.bulk_vr.final_structure, break_early_if_expensive=True
-        ):
+        if bulk_struct_w_oxi := _guess_and_set_bulk_oxi_states(self.bulk_vr.final_structure):
             self.bulk_vr.final_structure = self._bulk_oxi_states = bulk_struct_w_oxi
 
         self.defect_dict = {}
@@ -1273,20 +1781,22 @@ class DefectsParserVasp:
         mp = get_mp_context()  # https://github.com/python/cpython/pull/100229
         if self.processes is None:  # multiprocessing?
             # only multiprocess as much as makes sense, if only a handful of defect folders:
-            self.processes = min(max(1, mp.cpu_count() - 1), len(self.defect_folders) - 1)
+            self.processes = _get_memory_limited_processes(
+                min(max(1, mp.cpu_count() - 1), len(self.defect_folders) - 1), bulk_vr_path
+            )
 
         if self.processes <= 1:  # no multiprocessing
-            with tqdm(self.defect_folders, desc="Parsing defect calculations") as pbar:
+            subfolder = self.subfolder
+            with tqdm(self.defect_folders, desc="Parsing defect calculations", mininterval=0.5) as pbar:
                 for defect_folder in pbar:
+                    defect_folder_path = f"{defect_folder}/{subfolder}"
                     # set tqdm progress bar description to defect folder being parsed:
-                    pbar.set_description(f"Parsing {defect_folder}/{self.subfolder}".replace("/.", ""))
+                    _set_parsing_pbar_description(pbar, defect_folder, subfolder)
                     parsed_defect_entry, warnings_string, _folder = self._parse_defect_and_handle_warnings(
                         defect_folder
                     )
                     parsing_warnings.append(
-                        self._parse_parsing_warnings(
-                            warnings_string, defect_folder, f"{defect_folder}/{self.subfolder}"
-                        )
+                        self._parse_parsing_warnings(warnings_string, defect_folder, defect_folder_path)
                     )
                     if parsed_defect_entry is not None:
                         parsed_defect_entries.append(parsed_defect_entry)
@@ -1296,17 +1806,16 @@ class DefectsParserVasp:
             # corrections correctly set, before multiprocessing with the same settings for all folders:
             charged_defect_folder = None
             for possible_charged_defect_folder in self.defect_folders:
-                with contextlib.suppress(Exception):
-                    if abs(int(possible_charged_defect_folder[-1])) > 0:  # likely charged defect
-                        charged_defect_folder = possible_charged_defect_folder
+                if _is_likely_charged_defect_folder(possible_charged_defect_folder):
+                    charged_defect_folder = possible_charged_defect_folder
 
-            pbar = tqdm(total=len(self.defect_folders))
+            pbar = tqdm(total=len(self.defect_folders), mininterval=0.5)
             try:
                 if charged_defect_folder is not None:
                     # will throw warnings if dielectric is None / charge corrections not possible,
                     # and set self.skip_corrections appropriately
-                    pbar.set_description(  # set this first as desc is only set after parsing in function
-                        f"Parsing {charged_defect_folder}/{self.subfolder}".replace("/.", "")
+                    _set_parsing_pbar_description(  # set this first as desc is only set after parsing
+                        pbar, charged_defect_folder, self.subfolder, force=True
                     )
                     parsed_defect_entry, warnings_string, _folder = self._parse_defect_and_handle_warnings(
                         charged_defect_folder
@@ -1322,9 +1831,16 @@ class DefectsParserVasp:
                     if parsed_defect_entry is not None:
                         parsed_defect_entries.append(parsed_defect_entry)
 
-                # also load the other bulk corrections data if possible:
+                # also load the other bulk corrections data if possible (and needed):
+                # (not needed if all defects are known to be neutral, or if charge corrections can't be
+                # / aren't to be applied):
+                load_bulk_corrections_data = (
+                    not all(_is_neutral_defect_folder(folder) for folder in self.defect_folders)
+                    and self.dielectric is not None
+                    and not self.skip_corrections
+                )
                 for k, v in self.bulk_corrections_data.items():
-                    if v is None:
+                    if v is None and load_bulk_corrections_data:
                         with contextlib.suppress(Exception):
                             if k == "bulk_locpot_dict":
                                 self.bulk_corrections_data[k] = _get_bulk_locpot_dict(
@@ -1345,11 +1861,14 @@ class DefectsParserVasp:
                 ]
                 pbar.set_description("Setting up multiprocessing")
                 if self.processes > 1:
-                    with pool_manager(self.processes) as pool:  # parsed_defect_entry, warnings
-                        results = pool.imap_unordered(
-                            self._parse_defect_and_handle_warnings, folders_to_process
-                        )
-                        for result in results:  # result -> (defect_entry, warnings_string, folder)
+                    folders_to_process = _sort_by_vasprun_size(  # largest first, for load balancing
+                        folders_to_process, self.output_path, self.subfolder, folder_scans
+                    )
+                    # result -> (defect_entry, warnings_string, folder)
+                    with contextlib.closing(  # terminate pool if an error is raised in this loop
+                        _parse_defects_in_pool(self, folders_to_process, self.processes)
+                    ) as results:
+                        for result in results:
                             parsing_warnings.append(
                                 self._update_pbar_and_return_warnings_from_parsing(
                                     defect_entry=result[0],
@@ -1359,7 +1878,7 @@ class DefectsParserVasp:
                                 )
                             )
                             if result[0] is not None:
-                                parsed_defect_entries.append(result[0])
+                                parsed_defect_entries.append(self._share_bulk_data(result[0]))
 
             except Exception as exc:
                 pbar.close()
@@ -1389,20 +1908,13 @@ class DefectsParserVasp:
                 [_mention_bulk_path_subfolder_for_correction_warnings(warning) for warning in warning_list]
                 for warning_list in split_parsing_warnings
             ]
-            flattened_warnings_list = [
-                warning for warning_list in split_parsing_warnings for warning in warning_list
-            ]
             duplicate_warnings: dict[str, list[str]] = {
                 warning: []
-                for warning in set(flattened_warnings_list)
-                if flattened_warnings_list.count(warning) > 1 and "Parsing failed for " not in warning
+                for warning, count in Counter(chain.from_iterable(split_parsing_warnings)).items()
+                if count > 1 and "Parsing failed for " not in warning
             }
             new_parsing_warnings = []
-            parsing_errors_dict: dict[str, list[str]] = {
-                message.split("got error: ")[1]: []
-                for message in set(flattened_warnings_list)
-                if "Parsing failed for " in message
-            }
+            parsing_errors_dict: dict[str, list[str]] = {}  # {error: [defect_name]}
             multiple_files_warning_dict: dict[str, list[tuple]] = {
                 "vasprun.xml": [],
                 "OUTCAR": [],
@@ -1416,21 +1928,21 @@ class DefectsParserVasp:
                     if "Parsing failed for " in warning_message
                 ]
                 if failed_warnings:
-                    defect_name = failed_warnings[0].split("Parsing failed for ")[1].split(", got ")[0]
-                    error = failed_warnings[0].split("got error: ")[1]
-                    parsing_errors_dict[error].append(defect_name)
+                    defect_name, error = _split_failed_parsing_warning(failed_warnings[0])
+                    parsing_errors_dict.setdefault(error, []).append(defect_name)
                 elif "Warning(s) encountered" in warnings_list[0]:
-                    defect_name = warnings_list[0].split("when parsing ")[1].split(" at")[0]
+                    defect_name = warnings_list[0].partition("when parsing ")[2].partition(" at")[0]
                 else:
                     defect_name = None
 
                 new_warnings_list = []
                 for warning in warnings_list:
-                    if warning.startswith("Multiple"):
-                        file_type = warning.split("`")[1]
-                        directory = warning.split("directory: ")[1].split(". Using")[0]
-                        chosen_file = warning.split("Using ")[1].split(" to")[0]
-                        multiple_files_warning_dict[file_type].append((directory, chosen_file))
+                    if warning.startswith("Multiple") and (
+                        match := _MULTIPLE_FILES_WARNING_REGEX.match(warning)
+                    ):
+                        multiple_files_warning_dict[match["file_type"]].append(
+                            (match["directory"], match["chosen_file"])
+                        )
 
                     elif warning in duplicate_warnings:
                         duplicate_warnings[warning].append(defect_name)
@@ -1438,20 +1950,17 @@ class DefectsParserVasp:
                     else:
                         new_warnings_list.append(warning)
 
-                if [  # if we still have other warnings, keep them for parsing_warnings list
-                    warning
-                    for warning in new_warnings_list
-                    if "Warning(s) encountered" not in warning and "Parsing failed for " not in warning
-                ]:
-                    new_parsing_warnings.append(
-                        "\n".join(
-                            [
-                                warning
-                                for warning in new_warnings_list
-                                if "Parsing failed for " not in warning
-                            ]
-                        )
-                    )
+                kept_warnings = []
+                has_other_warnings = False
+                for warning in new_warnings_list:
+                    if "Parsing failed for " in warning:
+                        continue
+                    kept_warnings.append(warning)
+                    if "Warning(s) encountered" not in warning:
+                        has_other_warnings = True
+
+                if has_other_warnings:  # if we still have other warnings, keep them for parsing_warnings
+                    new_parsing_warnings.append("\n".join(kept_warnings))
 
             for error, defect_list in parsing_errors_dict.items():
                 if defect_list:
@@ -1497,30 +2006,34 @@ class DefectsParserVasp:
         parsed_defect_entries = sort_defect_entries(parsed_defect_entries)  # type: ignore
 
         # check if there are duplicate entries in the parsed defect entries, warn and remove:
-        energy_entries_dict: dict[float, list[DefectEntry]] = {}  # {energy: [defect_entry]}
+        energy_entries_dict: defaultdict[float, list[DefectEntry]] = defaultdict(list)  # {energy: [entry]}
+        duplicate_energies = []  # energies with more than one entry
         for defect_entry in parsed_defect_entries:  # find duplicates by comparing supercell energies
-            if defect_entry.sc_entry_energy in energy_entries_dict:
-                energy_entries_dict[defect_entry.sc_entry_energy].append(defect_entry)
-            else:
-                energy_entries_dict[defect_entry.sc_entry_energy] = [defect_entry]
-
-        for energy, entries_list in energy_entries_dict.items():
-            if len(entries_list) > 1:  # More than one entry with the same energy
-                # sort any duplicates by name length, name, folder length, folder (shorter preferred)
-                energy_entries_dict[energy] = sorted(
-                    entries_list,
-                    key=lambda x: (
-                        len(x.name),
-                        x.name,
-                        len(self._get_defect_folder(x)),
-                        self._get_defect_folder(x),
-                    ),
-                )
+            entries_list = energy_entries_dict[defect_entry.sc_entry_energy]
+            entries_list.append(defect_entry)
+            if len(entries_list) == 2:
+                duplicate_energies.append(defect_entry.sc_entry_energy)
+
+        defect_folders = {  # {id(entry): defect folder} for duplicates, used for sorting and warning
+            id(entry): self._get_defect_folder(entry)
+            for energy in duplicate_energies
+            for entry in energy_entries_dict[energy]
+        }
+        for energy in duplicate_energies:  # More than one entry with the same energy
+            # sort any duplicates by name length, name, folder length, folder (shorter preferred)
+            energy_entries_dict[energy].sort(
+                key=lambda x: (
+                    len(x.name),
+                    x.name,
+                    len(defect_folders[id(x)]),
+                    defect_folders[id(x)],
+                ),
+            )
 
-        if any(len(entries_list) > 1 for entries_list in energy_entries_dict.values()):
+        if duplicate_energies:
             duplicate_entry_names_folders_string = "\n".join(
                 "["
-                + ", ".join(f"{entry.name} ({self._get_defect_folder(entry)})" for entry in entries_list)
+                + ", ".join(f"{entry.name} ({defect_folders[id(entry)]})" for entry in entries_list)
                 + "]"
                 for entries_list in energy_entries_dict.values()
                 if len(entries_list) > 1
@@ -1534,33 +2047,23 @@ class DefectsParserVasp:
 
         # get any defect entries in parsed_defect_entries that share the same name (without charge):
         # first get any entries with duplicate names:
-        entries_to_rename = [
-            defect_entry
-            for defect_entry in parsed_defect_entries
-            if len(
-                [
-                    defect_entry
-                    for other_defect_entry in parsed_defect_entries
-                    if defect_entry.name == other_defect_entry.name
-                ]
-            )
-            > 1
-        ]
+        name_counts = Counter(defect_entry.name for defect_entry in parsed_defect_entries)
         # then get all entries with the same name(s), ignoring charge state (in case e.g. only duplicate
         # for one charge state etc):
+        names_wout_charge_to_rename = {
+            name.rsplit("_", 1)[0] for name, count in name_counts.items() if count > 1
+        }
         entries_to_rename = [
             defect_entry
             for defect_entry in parsed_defect_entries
-            if any(
-                defect_entry.name.rsplit("_", 1)[0] == other_defect_entry.name.rsplit("_", 1)[0]
-                for other_defect_entry in entries_to_rename
-            )
+            if defect_entry.name.rsplit("_", 1)[0] in names_wout_charge_to_rename
         ]
 
+        entry_ids_to_rename = {id(defect_entry) for defect_entry in entries_to_rename}
         self.defect_dict = {
             defect_entry.name: defect_entry
             for defect_entry in parsed_defect_entries
-            if defect_entry not in entries_to_rename
+            if id(defect_entry) not in entry_ids_to_rename
         }
 
         with contextlib.suppress(AttributeError, TypeError):  # sort by supercell frac cooords,
@@ -1597,34 +2100,32 @@ class DefectsParserVasp:
         FNV_correction_errors = []
         eFNV_correction_errors = []
         defect_thermo = self.get_defect_thermodynamics(check_compatibility=False, skip_dos_check=True)
+        fermi_stability_windows = defect_thermo._get_in_gap_fermi_level_stability_windows(
+            self.defect_dict.values()
+        )
+        shallow_charge_stability_tolerance = kwargs.get(
+            "shallow_charge_stability_tolerance",
+            min(error_tolerance, defect_thermo.band_gap * 0.1 if defect_thermo.band_gap else 0.05),
+        )
         for name, defect_entry in self.defect_dict.items():
             # first check if it's a stable defect:
-            fermi_stability_window = defect_thermo._get_in_gap_fermi_level_stability_window(defect_entry)
+            fermi_stability_window = fermi_stability_windows[defect_entry.name]
 
             if fermi_stability_window < 0 or (  # Note we avoid the prune_to_stable_entries() method here
                 defect_entry.is_shallow  # as this would require two ``DefectThermodynamics`` inits...
-                and fermi_stability_window
-                < kwargs.get(
-                    "shallow_charge_stability_tolerance",
-                    min(error_tolerance, defect_thermo.band_gap * 0.1 if defect_thermo.band_gap else 0.05),
-                )
+                and fermi_stability_window < shallow_charge_stability_tolerance
             ):
                 continue  # no charge correction warnings for unstable charge states
 
+            corrections_metadata = defect_entry.corrections_metadata
             if (
-                defect_entry.corrections_metadata.get("freysoldt_charge_correction_error", 0)
-                > error_tolerance
-            ):
-                FNV_correction_errors.append(
-                    (name, defect_entry.corrections_metadata["freysoldt_charge_correction_error"])
-                )
+                FNV_error := corrections_metadata.get("freysoldt_charge_correction_error", 0)
+            ) > error_tolerance:
+                FNV_correction_errors.append((name, FNV_error))
             if (
-                defect_entry.corrections_metadata.get("kumagai_charge_correction_error", 0)
-                > error_tolerance
-            ):
-                eFNV_correction_errors.append(
-                    (name, defect_entry.corrections_metadata["kumagai_charge_correction_error"])
-                )
+                eFNV_error := corrections_metadata.get("kumagai_charge_correction_error", 0)
+            ) > error_tolerance:
+                eFNV_correction_errors.append((name, eFNV_error))
 
         def _call_multiple_corrections_tolerance_warning(correction_errors, type="FNV"):
             long_name = "Freysoldt" if type == "FNV" else "Kumagai"
@@ -1682,12 +2183,20 @@ class DefectsParserVasp:
         # note that we also check if multiple charge corrections have been applied to the same defect
         # within the charge correction functions (with self._check_if_multiple_finite_size_corrections())
 
+        mismatching_INCAR_warnings = []
+        mismatching_kpoints_warnings = []
+        mismatching_potcars_warnings = []
+        for name, defect_entry in self.defect_dict.items():  # collect mismatches in a single pass
+            calculation_metadata = defect_entry.calculation_metadata
+            if mismatching := calculation_metadata.get("mismatching_INCAR_tags"):
+                mismatching_INCAR_warnings.append((name, set(mismatching)))
+            if mismatching := calculation_metadata.get("mismatching_KPOINTS"):
+                mismatching_kpoints_warnings.append((name, mismatching))
+            if mismatching := calculation_metadata.get("mismatching_POTCAR_symbols"):
+                mismatching_potcars_warnings.append((name, mismatching))
+
         mismatching_INCAR_warnings = sorted(
-            [
-                (name, set(defect_entry.calculation_metadata.get("mismatching_INCAR_tags")))
-                for name, defect_entry in self.defect_dict.items()
-                if defect_entry.calculation_metadata.get("mismatching_INCAR_tags")
-            ],
+            mismatching_INCAR_warnings,
             key=lambda x: (len(x[1]), x[0]),
             reverse=True,
         )  # sort by number of mismatches, reversed
@@ -1704,11 +2213,7 @@ class DefectsParserVasp:
             )
 
         mismatching_kpoints_warnings = sorted(
-            [
-                (name, defect_entry.calculation_metadata.get("mismatching_KPOINTS"))
-                for name, defect_entry in self.defect_dict.items()
-                if defect_entry.calculation_metadata.get("mismatching_KPOINTS")
-            ],
+            mismatching_kpoints_warnings,
             key=lambda x: (len(x[1]), x[0]),
             reverse=True,
         )
@@ -1727,11 +2232,7 @@ class DefectsParserVasp:
             )
 
         mismatching_potcars_warnings = sorted(
-            [
-                (name, defect_entry.calculation_metadata.get("mismatching_POTCAR_symbols"))
-                for name, defect_entry in self.defect_dict.items()
-                if defect_entry.calculation_metadata.get("mismatching_POTCAR_symbols")
-            ],
+            mismatching_potcars_warnings,
             key=lambda x: (len(x[1]), x[0]),
             reverse=True,
         )  # sort by number of mismatches, reversed
@@ -1777,6 +2278,37 @@ class DefectsParserVasp:
             .split("/")[-1 if self.subfolder == "." else -2]
         )
 
+    def _share_bulk_data(self, defect_entry: DefectEntry) -> DefectEntry:
+        """
+        Replace the bulk corrections data of a ``DefectEntry`` parsed in a
+        worker process (which are separate unpickled copies for each entry)
+        with read-only views of the single copies held by this parser, if
+        identical, to reduce memory usage when parsing many defects.
+
+        Only these arrays are shared (as read-only views, so that they cannot
+        be modified in-place through one entry and silently change the others);
+        mutable objects such as the bulk supercell ``Structure`` are kept as
+        separate copies for each entry.
+        """
+        for k, bulk_data in self.bulk_corrections_data.items():
+            entry_data = defect_entry.calculation_metadata.get(k)
+            if bulk_data is None or entry_data is None:
+                continue
+            if isinstance(bulk_data, dict):  # bulk_locpot_dict
+                if (
+                    entry_data.keys() == bulk_data.keys()
+                    and all(isinstance(array, np.ndarray) for array in bulk_data.values())
+                    and all(np.array_equal(entry_data[axis], bulk_data[axis]) for axis in bulk_data)
+                ):
+                    defect_entry.calculation_metadata[k] = {
+                        axis: _read_only_view(array) for axis, array in bulk_data.items()
+                    }
+            elif isinstance(bulk_data, np.ndarray) and np.array_equal(entry_data, bulk_data):
+                # bulk_site_potentials
+                defect_entry.calculation_metadata[k] = _read_only_view(bulk_data)
+
+        return defect_entry
+
     def _update_pbar_and_return_warnings_from_parsing(
         self,
         defect_entry: DefectEntry,
@@ -1792,7 +2324,7 @@ class DefectsParserVasp:
             defect_folder = self._get_defect_folder(defect_entry)
             defect_path = defect_entry.calculation_metadata.get("defect_path", "N/A")
             if pbar:
-                pbar.set_description(f"Parsing {defect_folder}/{self.subfolder}".replace("/.", ""))
+                _set_parsing_pbar_description(pbar, defect_folder, self.subfolder)
 
         if warnings_string:
             return self._parse_parsing_warnings(warnings_string, defect_folder, defect_path)
@@ -1811,29 +2343,83 @@ class DefectsParserVasp:
         Returns:
             tuple: (parsed_defect_entry, warnings_string, defect_folder)
         """
+        cache_path = cache_key = None
+        if self.cache:
+            cache_path, cache_key = self._get_parsed_defect_cache_path_and_key(defect_folder)
+            cached = _load_parsed_defect_cache(cache_path, cache_key)
+            if cached is not None:
+                parsed_defect_entry, warnings_string = cached
+                self._update_from_parsed_defect_entry(parsed_defect_entry)
+                return parsed_defect_entry, warnings_string, defect_folder
+
         with warnings.catch_warnings(record=True) as captured_warnings:
             parsed_defect_entry = self._parse_single_defect(defect_folder)
 
-        ignore_messages = [
-            "Estimated error",
-            "There are mismatching",
-            "The KPOINTS",
-            "The POTCAR",
-        ]  # collectively warned later
-
-        def _check_ignored_message_in_warning(warning_message):
-            if hasattr(warning_message, "args"):
-                return any(warning_message.args[0].startswith(i) for i in ignore_messages)
-            return any(warning_message.startswith(i) for i in ignore_messages)
-
         warnings_string = "\n\n".join(
             str(warning.message)
             for warning in captured_warnings
-            if not _check_ignored_message_in_warning(warning.message)
+            if not _is_ignored_parsing_warning(warning.message)
         )
+        if cache_path is not None and parsed_defect_entry is not None:
+            _save_parsed_defect_cache(cache_path, cache_key, parsed_defect_entry, warnings_string)
 
         return parsed_defect_entry, warnings_string, defect_folder
 
+    def _get_parsed_defect_cache_path_and_key(self, defect_folder: str) -> tuple[str, str]:
+        """
+        Get the path to the cached parsed ``DefectEntry`` for ``defect_folder``
+        and the key it must match to be reused, which changes if any file in
+        the defect or bulk folders is modified, or the parsing settings change.
+
+        Args:
+            defect_folder (str): The defect folder to parse.
+
+        Returns:
+            tuple: (cache_path, cache_key)
+        """
+        if self._bulk_files_key is None:
+            self._bulk_files_key = _folder_files_key(self.bulk_path)
+        bulk_band_gap_vr = getattr(self.bulk_band_gap_vr, "filename", self.bulk_band_gap_vr)
+        cache_key = _hash_cache_key(
+            (
+                _get_package_versions(),  # cached entries are only valid for the same code versions
+                _folder_files_key(os.path.join(self.output_path, defect_folder, self.subfolder)),
+                self._bulk_files_key,
+                self.dielectric,
+                self.skip_corrections,
+                self.error_tolerance,
+                _file_cache_key(bulk_band_gap_vr) if bulk_band_gap_vr else None,
+                self.parse_projected_eigen,
+                sorted(  # bulk corrections data is set from the (cached) parsed entries
+                    (k, v)
+                    for k, v in self.kwargs.items()
+                    if k not in {"bulk_locpot_dict", "bulk_site_potentials"}
+                ),
+            )
+        )
+        cache_path = os.path.join(self.output_path, ".doped_cache", f"{defect_folder}.pkl")
+        return cache_path, cache_key
+
+    def _update_from_parsed_defect_entry(self, defect_entry: DefectEntry | None):
+        """
+        Update ``skip_corrections`` and ``bulk_corrections_data`` from a parsed
+        ``DefectEntry``, so that the dielectric warning is only shown once and
+        the bulk corrections data is only parsed once.
+        """
+        if defect_entry is None:
+            return
+
+        if defect_entry.charge_state != 0 and self.dielectric is None:
+            self.skip_corrections = True  # set skip_corrections to True if dielectric is None and
+            # there are charged defects present (shows dielectric warning once)
+
+        for key in ["bulk_locpot_dict", "bulk_site_potentials"]:
+            if (
+                defect_entry.calculation_metadata.get(key) is not None
+                and self.bulk_corrections_data.get(key) is None
+            ):
+                self.bulk_corrections_data[key] = defect_entry.calculation_metadata[key]
+
     def _parse_single_defect(self, defect_folder):
         try:
             self.kwargs.update(self.bulk_corrections_data)  # update with bulk corrections data
@@ -1850,26 +2436,7 @@ class DefectsParserVasp:
                 parse_projected_eigen=self.parse_projected_eigen,
                 **self.kwargs,
             )
-
-            if dp.skip_corrections and dp.defect_entry.charge_state != 0 and self.dielectric is None:
-                self.skip_corrections = dp.skip_corrections  # set skip_corrections to True if
-                # dielectric is None and there are charged defects present (shows dielectric warning once)
-
-            if (
-                dp.defect_entry.calculation_metadata.get("bulk_locpot_dict") is not None
-                and self.bulk_corrections_data.get("bulk_locpot_dict") is None
-            ):
-                self.bulk_corrections_data["bulk_locpot_dict"] = dp.defect_entry.calculation_metadata[
-                    "bulk_locpot_dict"
-                ]
-
-            if (
-                dp.defect_entry.calculation_metadata.get("bulk_site_potentials") is not None
-                and self.bulk_corrections_data.get("bulk_site_potentials") is None
-            ):
-                self.bulk_corrections_data["bulk_site_potentials"] = (
-                    dp.defect_entry.calculation_metadata
-                )["bulk_site_potentials"]
+            self._update_from_parsed_defect_entry(dp.defect_entry)
 
         except Exception as exc:
             warnings.warn(
@@ -2089,6 +2656,201 @@ def _parse_vr_and_poss_procar(
     return vr, procar if parse_procar else vr
 
 
+def _read_only_view(array: np.ndarray) -> np.ndarray:
+    """
+    Get a read-only view of ``array``, which shares its memory but cannot be
+    used to modify it in-place.
+    """
+    view = array.view()
+    view.flags.writeable = False
+    return view
+
+
+def _file_cache_key(path: PathLike) -> tuple | None:
+    """
+    Get a hashable key for the file at ``path`` (real path, modification time
+    and size), which changes if the file is modified or replaced, or ``None``
+    if the file cannot be found.
+    """
+    try:
+        file_stat = os.stat(path)
+    except OSError:  # e.g. archived file; left to ``get_vasprun`` to find/handle
+        return None
+    return os.path.realpath(path), file_stat.st_mtime_ns, file_stat.st_size
+
+
+def _folder_files_key(path: PathLike) -> tuple:
+    """
+    Get a hashable key for the files in the folder at ``path`` (names,
+    modification times and sizes), which changes if any file in the folder is
+    added, modified or removed.
+    """
+    try:
+        with os.scandir(path) as entries:
+            return tuple(
+                sorted(
+                    (entry.name, entry.stat().st_mtime_ns, entry.stat().st_size)
+                    for entry in entries
+                    if entry.is_file()
+                )
+            )
+    except OSError:
+        return ()
+
+
+@lru_cache(maxsize=1)
+def _get_package_versions() -> tuple[str | None, ...]:
+    """
+    Get the installed ``doped`` and ``pymatgen`` versions (or ``None`` if
+    not found), which determine the contents of the pickled parsed defect
+    entries.
+    """
+    package_versions = []
+    for package in ["doped", "pymatgen", "pymatgen-analysis-defects"]:
+        try:
+            package_versions.append(version(package))
+        except PackageNotFoundError:
+            package_versions.append(None)
+
+    return tuple(package_versions)
+
+
+def _hash_cache_key(key_items: tuple) -> str:
+    """
+    Get a stable (SHA-256) hash of ``key_items`` for the parsed defect cache,
+    from their JSON serialisation (with arrays and ``MSONable`` objects
+    converted to lists and dicts), which unlike ``repr`` does not depend on
+    e.g. ``numpy`` print options.
+    """
+
+    def _default(obj):
+        if hasattr(obj, "tolist"):  # numpy arrays and scalars
+            return obj.tolist()
+        if hasattr(obj, "as_dict"):
+            return obj.as_dict()
+        return repr(obj)
+
+    return hashlib.sha256(json.dumps(key_items, default=_default, sort_keys=True).encode()).hexdigest()
+
+
+def _load_parsed_defect_cache(cache_path: PathLike, cache_key: str) -> tuple | None:
+    """
+    Load a cached ``(DefectEntry, warnings_string)`` tuple from
+    ``cache_path``, if it exists and was saved with ``cache_key``, otherwise
+    return ``None``.
+    """
+    try:
+        with open(cache_path, "rb") as f:
+            saved_key, defect_entry, warnings_string = pickle.load(f)
+    except (  # missing, outdated or corrupted cache file; re-parse
+        OSError,
+        EOFError,
+        pickle.UnpicklingError,
+        AttributeError,
+        ImportError,
+        ValueError,
+        TypeError,
+    ):
+        return None
+    return (defect_entry, warnings_string) if saved_key == cache_key else None
+
+
+def _save_parsed_defect_cache(
+    cache_path: PathLike, cache_key: str, defect_entry: DefectEntry, warnings_string: str
+):
+    """
+    Save a parsed ``DefectEntry`` and its warnings to ``cache_path``, with
+    ``cache_key`` to check its validity when reloading.
+
+    Written to a temporary file first and then moved to ``cache_path``, so
+    that partially-written cache files are never loaded.
+    """
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((cache_key, defect_entry, warnings_string), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception as exc:  # caching is only an optimisation, so don't fail parsing
+        warnings.warn(f"Could not save parsed defect cache file {cache_path}, got error: {exc!r}")
+
+
+def _get_bulk_band_gap_vr_band_edges(bulk_band_gap_vr_path: PathLike) -> tuple[float, float, float, bool]:
+    """
+    Get the ``eigenvalue_band_properties`` (band gap, CBM, VBM, is direct) of
+    the ``bulk_band_gap_vr`` ``vasprun.xml(.gz)``, streaming only the
+    eigenvalues from the file (see ``get_eigenvalue_band_properties``), cached
+    on the file path, modification time and size.
+    """
+    file_cache_key = _file_cache_key(
+        find_archived_fname(str(bulk_band_gap_vr_path), raise_error=False) or bulk_band_gap_vr_path
+    )
+    if file_cache_key is None:
+        return get_eigenvalue_band_properties(bulk_band_gap_vr_path)  # raises informative error
+    return _cached_get_bulk_band_gap_vr_band_edges(file_cache_key)
+
+
+@lru_cache(maxsize=8)
+def _cached_get_bulk_band_gap_vr_band_edges(file_cache_key: tuple) -> tuple[float, float, float, bool]:
+    return get_eigenvalue_band_properties(file_cache_key[0])
+
+
+def _is_bulk_supercell_vasprun(bulk_band_gap_vr_path: PathLike, bulk_path: PathLike | None) -> bool:
+    """
+    Check if ``bulk_band_gap_vr_path`` points to the bulk supercell
+    ``vasprun.xml(.gz)`` in ``bulk_path`` (in which case it does not need to be
+    parsed again, as the band edges are taken from the parsed bulk supercell
+    calculation by default).
+    """
+    if not bulk_path or not os.path.isdir(bulk_path):
+        return False
+    bulk_band_gap_vr_path = find_archived_fname(str(bulk_band_gap_vr_path), raise_error=False)
+    if bulk_band_gap_vr_path is None or os.path.isdir(bulk_band_gap_vr_path):
+        return False
+    if os.path.dirname(os.path.realpath(bulk_band_gap_vr_path)) != os.path.realpath(bulk_path):
+        return False  # quick check before listing the bulk directory
+
+    bulk_vr_path, _multiple = _get_output_files_and_check_if_multiple("vasprun.xml", bulk_path)
+    return os.path.realpath(bulk_band_gap_vr_path) == os.path.realpath(bulk_vr_path)
+
+
+def _guess_and_set_bulk_oxi_states(bulk_structure: Structure) -> Structure | bool:
+    """
+    Guess the oxidation states of the bulk supercell structure with
+    ``guess_and_set_oxi_states_with_timeout`` (with
+    ``break_early_if_expensive=True``), memoised on the structure
+    fingerprint, so that repeated ``DefectsParser`` initialisations with the
+    same bulk calculation (e.g. in notebooks or sweeps) only guess once.
+
+    If the structure already has oxidation states set (e.g. from a previous
+    parse with the same ``Vasprun`` object), these are used directly.
+
+    Returns:
+        Structure | bool:
+            A copy of the structure with oxidation states set, or ``False``
+            if oxidation states could not be guessed.
+    """
+    if all(hasattr(site.specie, "oxi_state") for site in bulk_structure.sites) and all(
+        isinstance(site.specie.oxi_state, int | float) for site in bulk_structure.sites
+    ):
+        return bulk_structure.copy()
+
+    cache_key = _structure_fingerprint(bulk_structure)
+    if cache_key not in _bulk_oxi_states_cache:
+        if len(_bulk_oxi_states_cache) >= 32:  # limit cache size, dropping the oldest entry
+            _bulk_oxi_states_cache.pop(next(iter(_bulk_oxi_states_cache)))
+        _bulk_oxi_states_cache[cache_key] = guess_and_set_oxi_states_with_timeout(
+            bulk_structure, break_early_if_expensive=True
+        )
+
+    bulk_struct_w_oxi = _bulk_oxi_states_cache[cache_key]
+    return bulk_struct_w_oxi.copy() if bulk_struct_w_oxi else bulk_struct_w_oxi
+
+
+# cleared with ``_bulk_oxi_states_cache.clear()``, e.g. in long-running processes:
+_bulk_oxi_states_cache: dict[tuple, Structure | bool] = {}
+
+
 class DefectParserVasp:
     def __init__(
         self,
@@ -2537,11 +3299,13 @@ class DefectParserVasp:
         dp.load_and_check_calculation_metadata()  # Load standard defect metadata
         dp.load_bulk_gap_data(bulk_band_gap_vr=bulk_band_gap_vr)  # Load band gap data
 
-        if not skip_corrections and defect_entry.charge_state != 0:
-            # no finite-size charge corrections by default for neutral defects
-            skip_corrections = dp._check_and_load_appropriate_charge_correction()
+        # no finite-size charge corrections by default for neutral defects, and the (large) bulk and
+        # defect ``LOCPOT``/``OUTCAR`` files are only read if corrections are to be applied:
+        _do_corrections = not skip_corrections and defect_entry.charge_state != 0
+        if _do_corrections:
+            _do_corrections = not dp._check_and_load_appropriate_charge_correction()
 
-        if not skip_corrections and defect_entry.charge_state != 0:
+        if _do_corrections:
             try:
                 dp.apply_corrections()
             except Exception as exc:
@@ -2588,9 +3352,9 @@ class DefectParserVasp:
         # determine charge correction to use, based on what output files are available (`LOCPOT`s or
         # `OUTCAR`s), and whether the supplied dielectric is isotropic or not
         def _check_folder_for_file_match(folder, filename):
-            return any(
-                filename.lower() in folder_filename.lower() for folder_filename in os.listdir(folder)
-            )
+            filename = filename.lower()
+            with os.scandir(folder) as entries:
+                return any(filename in entry.name.lower() for entry in entries)
 
         # check if dielectric (3x3 matrix) has diagonal elements that differ by more than 20%
         isotropic_dielectric = all(np.isclose(i, dielectric[0, 0], rtol=0.2) for i in np.diag(dielectric))
@@ -3074,10 +3838,15 @@ class DefectParserVasp:
             )
             gap_calculation_metadata["MP_gga_BScalc_data"] = None  # to signal no MP BS is used
 
-        if bulk_band_gap_vr:
-            if not isinstance(bulk_band_gap_vr, Vasprun):
-                bulk_band_gap_vr = get_vasprun(bulk_band_gap_vr, parse_projected_eigen=False)
+        if bulk_band_gap_vr and not isinstance(bulk_band_gap_vr, Vasprun):
+            if _is_bulk_supercell_vasprun(
+                bulk_band_gap_vr, self.defect_entry.calculation_metadata["bulk_path"]
+            ):
+                bulk_band_gap_vr = None  # no need to reparse, bulk supercell calc used by default
+            else:  # only the band edges are needed, so stream these from the file:
+                band_gap, cbm, vbm, _ = _get_bulk_band_gap_vr_band_edges(bulk_band_gap_vr)
 
+        elif bulk_band_gap_vr:
             band_gap, cbm, vbm, _ = bulk_band_gap_vr.eigenvalue_band_properties
 
         gap_calculation_metadata.update(
@@ -3608,11 +4377,13 @@ class DefectParserEspresso:
         dp.load_and_check_calculation_metadata()  # Load standard defect metadata
         dp.load_bulk_gap_data(bulk_band_gap_vr=bulk_band_gap_vr)  # Load band gap data
 
-        if not skip_corrections and defect_entry.charge_state != 0:
-            # no finite-size charge corrections by default for neutral defects
-            skip_corrections = dp._check_and_load_appropriate_charge_correction()
+        # no finite-size charge corrections by default for neutral defects, and the (large) bulk and
+        # defect ``LOCPOT``/``OUTCAR`` files are only read if corrections are to be applied:
+        _do_corrections = not skip_corrections and defect_entry.charge_state != 0
+        if _do_corrections:
+            _do_corrections = not dp._check_and_load_appropriate_charge_correction()
 
-        if not skip_corrections and defect_entry.charge_state != 0:
+        if _do_corrections:
             try:
                 dp.apply_corrections()
             except Exception as exc:
@@ -3659,9 +4430,9 @@ class DefectParserEspresso:
         # determine charge correction to use, based on what output files are available (`LOCPOT`s or
         # `OUTCAR`s), and whether the supplied dielectric is isotropic or not
         def _check_folder_for_file_match(folder, filename):
-            return any(
-                filename.lower() in folder_filename.lower() for folder_filename in os.listdir(folder)
-            )
+            filename = filename.lower()
+            with os.scandir(folder) as entries:
+                return any(filename in entry.name.lower() for entry in entries)
 
         # check if dielectric (3x3 matrix) has diagonal elements that differ by more than 20%
         isotropic_dielectric = all(np.isclose(i, dielectric[0, 0], rtol=0.2) for i in np.diag(dielectric))
@@ -4164,7 +4935,9 @@ class DefectParserEspresso:
 
         if bulk_band_gap_vr:
             if not isinstance(bulk_band_gap_vr, Vasprun):
-                bulk_band_gap_vr = get_vasprun(bulk_band_gap_vr, parse_projected_eigen=False)
+                bulk_band_gap_vr = get_vasprun(
+                    bulk_band_gap_vr, band_structure_only=True, parse_projected_eigen=False
+                )
 
             band_gap, cbm, vbm, _ = bulk_band_gap_vr.eigenvalue_band_properties
 
@@ -4237,12 +5010,24 @@ class DefectParserEspresso:
 
 #----new methods----
 
-from doped.utils.qehacks import PymatgenEspressoHacks
-PymatgenEspressoHacks.patch_pwxml_properties() #Allows setters for pwxml objects. 
+@lru_cache(maxsize=None)
+def _get_PWxml() -> type:
+    """
+    Import ``PWxml`` (only needed for Quantum Espresso parsing) on first use,
+    applying the ``PymatgenEspressoHacks`` patches (which allow setters for
+    ``PWxml`` objects), rather than at ``doped.analysis`` import time.
+    """
+    from pymatgen.io.espresso.outputs.pwxml import PWxml
 
+    PymatgenEspressoHacks.patch_pwxml_properties()
+    return PWxml
 
-import pandas as pd
-from pathlib import Path
+
+def __getattr__(name: str):
+    # lazily-imported module attributes (PEP 562), for Quantum Espresso-only dependencies:
+    if name == "PWxml":
+        return _get_PWxml()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class FolderHandler:
@@ -4314,13 +5099,12 @@ class FolderHandler:
 
         # Count how many of each known vasp_* type we find
         vasp_priority = [f"{code}_{calc}" for calc in ["ncl", "std", "nkred_std", "gam"]]
-        vasp_type_count_dict = {
-            vtype: sum(1 for name in subfolder_names if vtype in name)
-            for vtype in vasp_priority
-        }
+        vasp_type_count_dict = Counter(
+            next((vtype for vtype in vasp_priority if vtype in name), None) for name in subfolder_names
+        )
 
         # Pick the first one found
-        subfolder = next((vtype for vtype, count in vasp_type_count_dict.items() if count), ".")
+        subfolder = next((vtype for vtype in vasp_priority if vasp_type_count_dict[vtype]), ".")
 
         return str(subfolder)
 
@@ -4448,7 +5232,8 @@ class FolderHandler:
                             for dir in possible_defect_folders
                             if dir not in possible_bulk_folders
                             and (
-                                subfolder in os.listdir(os.path.join(output_path, dir)) or subfolder == "."
+                                subfolder == "."
+                                or os.path.exists(os.path.join(output_path, dir, subfolder))
                                 )
         ]
         return defect_folders
@@ -4556,12 +5341,20 @@ class DefectsParserEspresso(DefectsParserVasp):
         Needed for espresso???
         """
 
+        mismatching_INCAR_warnings = []
+        mismatching_kpoints_warnings = []
+        mismatching_potcars_warnings = []
+        for name, defect_entry in self.defect_dict.items():  # collect mismatches in a single pass
+            calculation_metadata = defect_entry.calculation_metadata
+            if mismatching := calculation_metadata.get("mismatching_INCAR_tags"):
+                mismatching_INCAR_warnings.append((name, set(mismatching)))
+            if mismatching := calculation_metadata.get("mismatching_KPOINTS"):
+                mismatching_kpoints_warnings.append((name, mismatching))
+            if mismatching := calculation_metadata.get("mismatching_POTCAR_symbols"):
+                mismatching_potcars_warnings.append((name, mismatching))
+
         mismatching_INCAR_warnings = sorted(
-            [
-                (name, set(defect_entry.calculation_metadata.get("mismatching_INCAR_tags")))
-                for name, defect_entry in self.defect_dict.items()
-                if defect_entry.calculation_metadata.get("mismatching_INCAR_tags")
-            ],
+            mismatching_INCAR_warnings,
             key=lambda x: (len(x[1]), x[0]),
             reverse=True,
         )  # sort by number of mismatches, reversed
@@ -4578,11 +5371,7 @@ class DefectsParserEspresso(DefectsParserVasp):
             )
 
         mismatching_kpoints_warnings = sorted(
-            [
-                (name, defect_entry.calculation_metadata.get("mismatching_KPOINTS"))
-                for name, defect_entry in self.defect_dict.items()
-                if defect_entry.calculation_metadata.get("mismatching_KPOINTS")
-            ],
+            mismatching_kpoints_warnings,
             key=lambda x: (len(x[1]), x[0]),
             reverse=True,
         )
@@ -4601,11 +5390,7 @@ class DefectsParserEspresso(DefectsParserVasp):
             )
 
         mismatching_potcars_warnings = sorted(
-            [
-                (name, defect_entry.calculation_metadata.get("mismatching_POTCAR_symbols"))
-                for name, defect_entry in self.defect_dict.items()
-                if defect_entry.calculation_metadata.get("mismatching_POTCAR_symbols")
-            ],
+            mismatching_potcars_warnings,
             key=lambda x: (len(x[1]), x[0]),
             reverse=True,
         )  # sort by number of mismatches, reversed
@@ -4641,10 +5426,13 @@ class DefectsParserEspresso(DefectsParserVasp):
         FNV_correction_errors = []
         eFNV_correction_errors = []
         defect_thermo = self.get_defect_thermodynamics(check_compatibility=False, skip_dos_check=True)
+        fermi_stability_windows = defect_thermo._get_in_gap_fermi_level_stability_windows(
+            self.defect_dict.values()
+        )
         for name, defect_entry in self.defect_dict.items():
             # print("CHARGE_CORRECTION: ", name, defect_entry)
             # first check if it's a stable defect:
-            fermi_stability_window = defect_thermo._get_in_gap_fermi_level_stability_window(defect_entry)
+            fermi_stability_window = fermi_stability_windows[defect_entry.name]
 
             if fermi_stability_window < 0 or (  # Note we avoid the prune_to_stable_entries() method here
                 defect_entry.is_shallow  # as this would require two ``DefectThermodynamics`` inits...
@@ -4656,20 +5444,15 @@ class DefectsParserEspresso(DefectsParserVasp):
             ):
                 continue  # no charge correction warnings for unstable charge states
 
+            corrections_metadata = defect_entry.corrections_metadata
             if (
-                defect_entry.corrections_metadata.get("freysoldt_charge_correction_error", 0)
-                > error_tolerance
-            ):
-                FNV_correction_errors.append(
-                    (name, defect_entry.corrections_metadata["freysoldt_charge_correction_error"])
-                )
+                FNV_error := corrections_metadata.get("freysoldt_charge_correction_error", 0)
+            ) > error_tolerance:
+                FNV_correction_errors.append((name, FNV_error))
             if (
-                defect_entry.corrections_metadata.get("kumagai_charge_correction_error", 0)
-                > error_tolerance
-            ):
-                eFNV_correction_errors.append(
-                    (name, defect_entry.corrections_metadata["kumagai_charge_correction_error"])
-                )
+                eFNV_error := corrections_metadata.get("kumagai_charge_correction_error", 0)
+            ) > error_tolerance:
+                eFNV_correction_errors.append((name, eFNV_error))
 
 
         def _call_multiple_corrections_tolerance_warning(correction_errors, type="FNV"):
@@ -4731,30 +5514,34 @@ class DefectsParserEspresso(DefectsParserVasp):
 
     def _warn_remove_duplicate_parsed_defect_entries(self, parsed_defect_entries):
         # check if there are duplicate entries in the parsed defect entries, warn and remove:
-        energy_entries_dict: dict[float, list[DefectEntry]] = {}  # {energy: [defect_entry]}
+        energy_entries_dict: defaultdict[float, list[DefectEntry]] = defaultdict(list)  # {energy: [entry]}
+        duplicate_energies = []  # energies with more than one entry
         for defect_entry in parsed_defect_entries:  # find duplicates by comparing supercell energies
-            if defect_entry.sc_entry_energy in energy_entries_dict:
-                energy_entries_dict[defect_entry.sc_entry_energy].append(defect_entry)
-            else:
-                energy_entries_dict[defect_entry.sc_entry_energy] = [defect_entry]
-
-        for energy, entries_list in energy_entries_dict.items():
-            if len(entries_list) > 1:  # More than one entry with the same energy
-                # sort any duplicates by name length, name, folder length, folder (shorter preferred)
-                energy_entries_dict[energy] = sorted(
-                    entries_list,
-                    key=lambda x: (
-                        len(x.name),
-                        x.name,
-                        len(self._get_defect_folder(x)),
-                        self._get_defect_folder(x),
-                    ),
-                )
+            entries_list = energy_entries_dict[defect_entry.sc_entry_energy]
+            entries_list.append(defect_entry)
+            if len(entries_list) == 2:
+                duplicate_energies.append(defect_entry.sc_entry_energy)
+
+        defect_folders = {  # {id(entry): defect folder} for duplicates, used for sorting and warning
+            id(entry): self._get_defect_folder(entry)
+            for energy in duplicate_energies
+            for entry in energy_entries_dict[energy]
+        }
+        for energy in duplicate_energies:  # More than one entry with the same energy
+            # sort any duplicates by name length, name, folder length, folder (shorter preferred)
+            energy_entries_dict[energy].sort(
+                key=lambda x: (
+                    len(x.name),
+                    x.name,
+                    len(defect_folders[id(x)]),
+                    defect_folders[id(x)],
+                ),
+            )
 
-        if any(len(entries_list) > 1 for entries_list in energy_entries_dict.values()):
+        if duplicate_energies:
             duplicate_entry_names_folders_string = "\n".join(
                 "["
-                + ", ".join(f"{entry.name} ({self._get_defect_folder(entry)})" for entry in entries_list)
+                + ", ".join(f"{entry.name} ({defect_folders[id(entry)]})" for entry in entries_list)
                 + "]"
                 for entries_list in energy_entries_dict.values()
                 if len(entries_list) > 1
@@ -4769,33 +5556,23 @@ class DefectsParserEspresso(DefectsParserVasp):
 
         # get any defect entries in parsed_defect_entries that share the same name (without charge):
         # first get any entries with duplicate names:
-        entries_to_rename = [
-            defect_entry
-            for defect_entry in parsed_defect_entries
-            if len(
-                [
-                    defect_entry
-                    for other_defect_entry in parsed_defect_entries
-                    if defect_entry.name == other_defect_entry.name
-                ]
-            )
-            > 1
-        ]
+        name_counts = Counter(defect_entry.name for defect_entry in parsed_defect_entries)
         # then get all entries with the same name(s), ignoring charge state (in case e.g. only duplicate
         # for one charge state etc):
+        names_wout_charge_to_rename = {
+            name.rsplit("_", 1)[0] for name, count in name_counts.items() if count > 1
+        }
         entries_to_rename = [
             defect_entry
             for defect_entry in parsed_defect_entries
-            if any(
-                defect_entry.name.rsplit("_", 1)[0] == other_defect_entry.name.rsplit("_", 1)[0]
-                for other_defect_entry in entries_to_rename
-            )
+            if defect_entry.name.rsplit("_", 1)[0] in names_wout_charge_to_rename
         ]
 
+        entry_ids_to_rename = {id(defect_entry) for defect_entry in entries_to_rename}
         self.defect_dict = {
             defect_entry.name: defect_entry
             for defect_entry in parsed_defect_entries
-            if defect_entry not in entries_to_rename
+            if id(defect_entry) not in entry_ids_to_rename
         }
 
         
@@ -4848,9 +5625,7 @@ class DefectsParserEspresso(DefectsParserVasp):
  
     def _get_bulk_oxi_states(self):
         self._bulk_oxi_states: Structure | Composition | dict | bool = False
-        if bulk_struct_w_oxi := guess_and_set_oxi_states_with_timeout(
-            self.bulk_vr.final_structure, break_early_if_expensive=True
-        ):
+        if bulk_struct_w_oxi := _guess_and_set_bulk_oxi_states(self.bulk_vr.final_structure):
             self.bulk_vr.final_structure = self._bulk_oxi_states = bulk_struct_w_oxi
 
     def _process_parsing_warnings(self, parsing_warnings):
@@ -4875,17 +5650,13 @@ class DefectsParserEspresso(DefectsParserVasp):
             [_mention_bulk_path_subfolder_for_correction_warnings(w) for w in wlist]
             for wlist in split_parsing_warnings
         ]
-        flattened = [w for wlist in split_parsing_warnings for w in wlist]
 
         # Track duplicates and errors
         duplicate_warnings = {
-            w: [] for w in set(flattened)
-            if flattened.count(w) > 1 and "Parsing failed for " not in w
-        }
-        parsing_errors_dict = {
-            w.split("got error: ")[1]: []
-            for w in set(flattened) if "Parsing failed for " in w
+            w: [] for w, count in Counter(chain.from_iterable(split_parsing_warnings)).items()
+            if count > 1 and "Parsing failed for " not in w
         }
+        parsing_errors_dict: dict[str, list[str]] = {}  # {error: [defect]}
         multiple_files_warning_dict = {"vasprun.xml": [], "OUTCAR": [], "LOCPOT": []}
 
         new_parsing_warnings = []
@@ -4893,30 +5664,35 @@ class DefectsParserEspresso(DefectsParserVasp):
         for wlist in split_parsing_warnings:
             failed = [w for w in wlist if "Parsing failed for " in w]
             if failed:
-                defect = failed[0].split("Parsing failed for ")[1].split(", got ")[0]
-                error = failed[0].split("got error: ")[1]
-                parsing_errors_dict[error].append(defect)
+                defect, error = _split_failed_parsing_warning(failed[0])
+                parsing_errors_dict.setdefault(error, []).append(defect)
             elif "Warning(s) encountered" in wlist[0]:
-                defect = wlist[0].split("when parsing ")[1].split(" at")[0]
+                defect = wlist[0].partition("when parsing ")[2].partition(" at")[0]
             else:
                 defect = None
 
             filtered = []
             for w in wlist:
-                if w.startswith("Multiple"):
-                    file_type = w.split("`")[1]
-                    directory = w.split("directory: ")[1].split(". Using")[0]
-                    chosen_file = w.split("Using ")[1].split(" to")[0]
-                    multiple_files_warning_dict[file_type].append((directory, chosen_file))
+                if w.startswith("Multiple") and (match := _MULTIPLE_FILES_WARNING_REGEX.match(w)):
+                    multiple_files_warning_dict[match["file_type"]].append(
+                        (match["directory"], match["chosen_file"])
+                    )
                 elif w in duplicate_warnings:
                     duplicate_warnings[w].append(defect)
                 else:
                     filtered.append(w)
 
-            if any("Warning(s) encountered" not in w and "Parsing failed for " not in w for w in filtered):
-                new_parsing_warnings.append(
-                    "\n".join(w for w in filtered if "Parsing failed for " not in w)
-                )
+            kept = []
+            has_other = False
+            for w in filtered:
+                if "Parsing failed for " in w:
+                    continue
+                kept.append(w)
+                if "Warning(s) encountered" not in w:
+                    has_other = True
+
+            if has_other:
+                new_parsing_warnings.append("\n".join(kept))
 
         # Report parsing errors
         for error, defects in parsing_errors_dict.items():
@@ -4966,13 +5742,15 @@ class DefectsParserEspresso(DefectsParserVasp):
         # Serial processing
         if self.processes <= 1:
             # print("SERIAL:")
-            with tqdm(self.defect_folders, desc="Parsing defect calculations") as pbar:
+            subfolder = self.subfolder
+            with tqdm(self.defect_folders, desc="Parsing defect calculations", mininterval=0.5) as pbar:
                 for defect_folder in pbar:
                     print("Defect Folders: ", self.defect_folders)
-                    pbar.set_description(f"Parsing {defect_folder}/{self.subfolder}".replace("/.", ""))
+                    defect_folder_path = f"{defect_folder}/{subfolder}"
+                    _set_parsing_pbar_description(pbar, defect_folder, subfolder)
                     parsed_defect_entry, warnings_string, _folder = self._parse_defect_and_handle_warnings(defect_folder)
                     parsing_warnings.append(
-                        self._parse_parsing_warnings(warnings_string, defect_folder, f"{defect_folder}/{self.subfolder}")
+                        self._parse_parsing_warnings(warnings_string, defect_folder, defect_folder_path)
                     )
                     if parsed_defect_entry is not None:
                         parsed_defect_entries.append(parsed_defect_entry)
@@ -4982,14 +5760,13 @@ class DefectsParserEspresso(DefectsParserVasp):
             print("MULTIPLE:")
             charged_defect_folder = None
             for folder in self.defect_folders:
-                with contextlib.suppress(Exception):
-                    if abs(int(folder[-1])) > 0:
-                        charged_defect_folder = folder
-                        break
-            pbar = tqdm(total=len(self.defect_folders))
+                if _is_likely_charged_defect_folder(folder):
+                    charged_defect_folder = folder
+                    break
+            pbar = tqdm(total=len(self.defect_folders), mininterval=0.5)
             try:
                 if charged_defect_folder is not None:
-                    pbar.set_description(f"Parsing {charged_defect_folder}/{self.subfolder}".replace("/.", ""))
+                    _set_parsing_pbar_description(pbar, charged_defect_folder, self.subfolder, force=True)
                     parsed_defect_entry, warnings_string, _folder = self._parse_defect_and_handle_warnings(charged_defect_folder)
                     parsing_warnings.append(
                         self._update_pbar_and_return_warnings_from_parsing(parsed_defect_entry, warnings_string, charged_defect_folder, pbar)
@@ -4997,9 +5774,16 @@ class DefectsParserEspresso(DefectsParserVasp):
                     if parsed_defect_entry is not None:
                         parsed_defect_entries.append(parsed_defect_entry)
 
-                # Try to populate missing bulk corrections
+                # Try to populate missing bulk corrections (if needed)
+                # (not needed if all defects are known to be neutral, or if charge corrections can't be
+                # / aren't to be applied):
+                load_bulk_corrections_data = (
+                    not all(_is_neutral_defect_folder(folder) for folder in self.defect_folders)
+                    and self.dielectric is not None
+                    and not self.skip_corrections
+                )
                 for k, v in self.bulk_corrections_data.items():
-                    if v is None:
+                    if v is None and load_bulk_corrections_data:
                         with contextlib.suppress(Exception):
                             if k == "bulk_locpot_dict":
                                 self.bulk_corrections_data[k] = _get_bulk_locpot_dict(self.bulk_path, quiet=True)
@@ -5018,8 +5802,9 @@ class DefectsParserEspresso(DefectsParserVasp):
                 pbar.set_description("Setting up multiprocessing")
 
                 if self.processes > 1:
-                    with pool_manager(self.processes) as pool:
-                        results = pool.imap_unordered(self._parse_defect_and_handle_warnings, folders_to_process)
+                    with contextlib.closing(  # terminate pool if an error is raised in this loop
+                        _parse_defects_in_pool(self, folders_to_process, self.processes)
+                    ) as results:
                         for result in results:
                             parsing_warnings.append(
                                 self._update_pbar_and_return_warnings_from_parsing(
@@ -5030,7 +5815,7 @@ class DefectsParserEspresso(DefectsParserVasp):
                                 )
                             )
                             if result[0] is not None:
-                                parsed_defect_entries.append(result[0])
+                                parsed_defect_entries.append(self._share_bulk_data(result[0]))
 
             except Exception as exc:
                 pbar.close()
@@ -5055,22 +5840,10 @@ class DefectsParserEspresso(DefectsParserVasp):
         with warnings.catch_warnings(record=True) as captured_warnings:
             parsed_defect_entry = self._parse_single_defect(defect_folder)
 
-        ignore_messages = [
-            "Estimated error",
-            "There are mismatching",
-            "The KPOINTS",
-            "The POTCAR",
-        ]  # collectively warned later
-
-        def _check_ignored_message_in_warning(warning_message):
-            if hasattr(warning_message, "args"):
-                return any(warning_message.args[0].startswith(i) for i in ignore_messages)
-            return any(warning_message.startswith(i) for i in ignore_messages)
-
         warnings_string = "\n\n".join(
             str(warning.message)
             for warning in captured_warnings
-            if not _check_ignored_message_in_warning(warning.message)
+            if not _is_ignored_parsing_warning(warning.message)
         )
 
         return parsed_defect_entry, warnings_string, defect_folder
@@ -5079,8 +5852,9 @@ class DefectsParserEspresso(DefectsParserVasp):
         try:
             self.kwargs.update(self.bulk_corrections_data)  # update with bulk corrections data
             defect_path = os.path.join(self.output_path, defect_folder, self.subfolder)
-            dp = DefectParser(code=self.code).from_paths(
+            dp = DefectParser.from_paths(
                 defect_path=defect_path,
+                code=self.code,
                 bulk_path=self.bulk_path,
                 bulk_vr=self.bulk_vr,
                 bulk_procar=self.bulk_procar,
@@ -5127,16 +5901,6 @@ class DefectsParserEspresso(DefectsParserVasp):
 
 
 
-from pymatgen.util.typing import PathLike, SpeciesLike
-import warnings
-from pymatgen.io.vasp.inputs import POTCAR_STATS_PATH, UnknownPotcarWarning
-from functools import lru_cache, partialmethod
-from doped.utils.parsing import parse_projected_eigen, find_archived_fname
-
-from pymatgen.io.vasp.outputs import Locpot, Outcar, Procar, Vasprun, _parse_vasp_array
-
-from pymatgen.io.espresso.outputs.pwxml import PWxml
-
 class RunParserEspresso():
     @classmethod
     def get_run(cls, espressorun_path: PathLike, parse_mag: bool = False, **kwargs):
@@ -5162,7 +5926,7 @@ class RunParserEspresso():
         from pymatgen.electronic_structure.core import Spin
         try:
             with warnings.catch_warnings(record=True) as w:
-                vasprun = PWxml(find_archived_fname(espressorun_path), **default_kwargs)
+                vasprun = _get_PWxml()(find_archived_fname(espressorun_path), **default_kwargs)
 
                 
                 #hacks because PWxml does not initialize atomic states and kpoints_opt_props
@@ -5248,3 +6012,9 @@ class RunParserEspresso():
                 vasprun_obj.band_gap = vasprun_obj.cbm - vasprun_obj.vbm
 
         return vasprun_obj
+
+
+# code -> class mappings for the front-end ``DefectsParser``, ``DefectParser`` and ``RunParser`` classes:
+_DEFECTS_PARSERS: dict[str, type] = {"vasp": DefectsParserVasp, "espresso": DefectsParserEspresso}
+_DEFECT_PARSERS: dict[str, type] = {"vasp": DefectParserVasp, "espresso": DefectParserEspresso}
+_RUN_PARSERS: dict[str, type] = {"espresso": RunParserEspresso}  # no ``RunParserVasp`` (yet)
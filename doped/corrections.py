@@ -487,33 +487,38 @@ def get_kumagai_correction(
         if defect_coords is None:
             defect_coords = structure_analyzer.defect_center_coord
         lattice = calc_results.structure.lattice
-        sites, rel_coords = [], []
-
-        excluded_indices = [] if excluded_indices is None else [int(i) for i in excluded_indices]
-
-        for d, p in structure_analyzer.atom_mapping.items():
-            if d not in excluded_indices:
-                specie = str(calc_results.structure[d].specie)
-                frac_coords = calc_results.structure[d].frac_coords
-                distance, _ = lattice.get_distance_and_image(defect_coords, frac_coords)
-                pot = calc_results.potentials[d] - perfect_calc_results.potentials[p]
-                sites.append(PotentialSite(specie, distance, pot, None))
-                coord = calc_results.structure[d].frac_coords
-                rel_coords.append([x - y for x, y in zip(coord, defect_coords, strict=False)])
+        excluded_indices = set() if excluded_indices is None else {int(i) for i in excluded_indices}
+        atom_mapping = [(d, p) for d, p in structure_analyzer.atom_mapping.items() if d not in excluded_indices]
+        defect_idxs = np.array([d for d, _p in atom_mapping], dtype=int)
+        perfect_idxs = np.array([p for _d, p in atom_mapping], dtype=int)
+
+        # get (minimum image) distances to the defect, potential differences and relative coordinates for
+        # all sites at once:
+        frac_coords = calc_results.structure.frac_coords[defect_idxs]
+        distances = lattice.get_all_distances(defect_coords, frac_coords).ravel()
+        pots = (
+            np.asarray(calc_results.potentials)[defect_idxs]
+            - np.asarray(perfect_calc_results.potentials)[perfect_idxs]
+        )
+        rel_coords = frac_coords - np.asarray(defect_coords)
+        sites = [
+            PotentialSite(str(calc_results.structure[d].specie), distance, pot, None)
+            for d, distance, pot in zip(defect_idxs.tolist(), distances.tolist(), pots.tolist(), strict=True)
+        ]
 
-        lattice = calc_results.structure.lattice
         ewald = Ewald(lattice.matrix, dielectric_tensor, accuracy=accuracy)
         point_charge_correction = -ewald.lattice_energy * charge**2 if charge else 0.0
 
         if defect_region_radius is None:
             defect_region_radius = calc_max_sphere_radius(lattice.matrix)
 
-        for site, rel_coord in zip(sites, rel_coords, strict=False):
-            if site.distance > defect_region_radius:
-                if charge == 0:
-                    site.pc_potential = 0
-                else:
-                    site.pc_potential = ewald.atomic_site_potential(rel_coord) * charge * unit_conversion
+        for site_idx in np.where(distances > defect_region_radius)[0]:  # sampling region
+            if charge == 0:
+                sites[site_idx].pc_potential = 0
+            else:
+                sites[site_idx].pc_potential = (
+                    ewald.atomic_site_potential(rel_coords[site_idx]) * charge * unit_conversion
+                )
 
         return ExtendedFnvCorrection(
             charge=charge,
@@ -2450,9 +2450,10 @@ class DefectThermodynamics(MSONable):
         stability_tol = None if unstable_entries == "not shallow" else charge_stability_tolerance
 
         pruned_defect_entries = {}
+        fermi_stability_windows = self._get_in_gap_fermi_level_stability_windows()
 
         for name, defect_entry in self.defect_entries.items():
-            fermi_stability_window = self._get_in_gap_fermi_level_stability_window(defect_entry)
+            fermi_stability_window = fermi_stability_windows[defect_entry.name]
             if stability_tol is not None and fermi_stability_window < stability_tol:
                 continue  # skip
 
@@ -4131,17 +4132,53 @@ class DefectThermodynamics(MSONable):
             defect_entry = self.defect_entries[defect_entry]
         assert isinstance(defect_entry, DefectEntry)
 
-        stable_entries_name_dict = {
-            name: [ent.name for ent in entry_list] for name, entry_list in self.stable_entries.items()
+        return self._get_in_gap_fermi_level_stability_windows([defect_entry])[defect_entry.name]
+
+    def _get_in_gap_fermi_level_stability_windows(
+        self, defect_entries: Iterable[DefectEntry] | None = None
+    ) -> dict[str, float]:
+        """
+        Convenience method to calculate the in-gap Fermi level stability
+        windows (see ``_get_in_gap_fermi_level_stability_window``) of multiple
+        defect entries at once, determining the grouped stable entry names
+        only once rather than for each entry.
+
+        Args:
+            defect_entries (Iterable[DefectEntry]):
+                ``DefectEntry`` objects to calculate the stability windows
+                for. If ``None`` (default), uses all entries in
+                ``DefectThermodynamics.defect_entries``.
+
+        Returns:
+            dict[str, float]:
+                Dictionary of ``{defect entry name: stability window}``.
+        """
+        if defect_entries is None:
+            defect_entries = self.defect_entries.values()
+
+        grouped_defect_names_wout_charge: dict[str, str] = {}  # {entry name: grouped name wout charge}
+        for name, entry_list in self.stable_entries.items():
+            for entry in entry_list:
+                grouped_defect_names_wout_charge.setdefault(entry.name, name)
+
+        return {
+            defect_entry.name: self._get_fermi_level_stability_window_from_tls(
+                defect_entry, grouped_defect_names_wout_charge.get(defect_entry.name)
+            )
+            for defect_entry in defect_entries
         }
-        if not any(defect_entry.name in name_list for name_list in stable_entries_name_dict.values()):
-            return -np.inf
 
-        grouped_defect_name_wout_charge = next(
-            name
-            for name in stable_entries_name_dict
-            if defect_entry.name in stable_entries_name_dict[name]
-        )
+    def _get_fermi_level_stability_window_from_tls(
+        self, defect_entry: DefectEntry, grouped_defect_name_wout_charge: str | None
+    ) -> float:
+        """
+        Get the in-gap Fermi level stability window of ``defect_entry`` from
+        the transition levels of its (stable) defect group, or ``-np.inf`` if
+        it is not a stable charge state (``grouped_defect_name_wout_charge``
+        is ``None``).
+        """
+        if grouped_defect_name_wout_charge is None:
+            return -np.inf
 
         # get highest and lowest TL (defining stability window):
         lowest = np.inf
@@ -33,6 +33,7 @@ from scipy.spatial import Voronoi
 if TYPE_CHECKING:
     from doped.core import Vacancy
 
+
 # Note that any overrides of ``__eq__`` should also override ``__hash__``, and vice versa
 
 
@@ -267,6 +268,19 @@ def _structure__hash__(self):
     return hash((self.lattice, frozenset(self.sites)))
 
 
+def _structure_fingerprint(structure: Structure) -> tuple:
+    """
+    Cheap, hashable fingerprint of a ``Structure`` (lattice matrix, site
+    species and fractional coordinates), for use as a cache key in place of
+    the (comparatively slow) full ``Structure`` hash and equality checks.
+    """
+    return (
+        structure.lattice.matrix.tobytes(),
+        tuple(site.species_string for site in structure),
+        structure.frac_coords.tobytes(),
+    )
+
+
 @contextlib.contextmanager
 def cache_species(structure_cls):
     """
@@ -864,11 +878,24 @@ def get_voronoi_nodes(structure: Structure) -> list[PeriodicSite]:
         list[PeriodicSite]:
             List of ``PeriodicSite`` objects representing the Voronoi nodes.
     """
-    try:
-        return _hashable_get_voronoi_nodes(structure)
-    except TypeError:
-        structure.__hash__ = _structure__hash__  # make sure Structure is hashable
-        return _hashable_get_voronoi_nodes(structure)
+    # check the cheap structure fingerprint cache first, as the same (bulk) supercell is typically used
+    # for many defects when parsing, and hashing/comparing full ``Structure`` objects is comparatively slow:
+    fingerprint = _structure_fingerprint(structure)
+    if fingerprint not in _voronoi_nodes_cache:
+        try:
+            voronoi_nodes = _hashable_get_voronoi_nodes(structure)
+        except TypeError:
+            structure.__hash__ = _structure__hash__  # make sure Structure is hashable
+            voronoi_nodes = _hashable_get_voronoi_nodes(structure)
+
+        if len(_voronoi_nodes_cache) >= 100:  # limit cache size, dropping the oldest entry
+            _voronoi_nodes_cache.pop(next(iter(_voronoi_nodes_cache)))
+        _voronoi_nodes_cache[fingerprint] = voronoi_nodes
+
+    return _voronoi_nodes_cache[fingerprint]
+
+
+_voronoi_nodes_cache: dict[tuple, list[PeriodicSite]] = {}
 
 
 @lru_cache(maxsize=int(1e2))
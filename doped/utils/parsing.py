@@ -3,17 +3,19 @@ Helper functions for parsing defect supercell calculations.
 """
 
 import contextlib
+import io
 import itertools
 import logging
 import os
 import re
 import warnings
+from collections.abc import Iterable
 from copy import deepcopy
 from functools import lru_cache, partialmethod
 from xml.etree.ElementTree import Element as XML_Element
 
 import numpy as np
-from monty.io import reverse_readfile
+from monty.io import reverse_readfile, zopen
 from monty.serialization import loadfn
 from pymatgen.analysis.defects.core import DefectType
 from pymatgen.analysis.structure_matcher import LinearAssignment, pbc_shortest_vectors
@@ -22,11 +24,33 @@ from pymatgen.core.structure import Composition, Lattice, PeriodicSite, Structur
 from pymatgen.electronic_structure.core import Spin
 from pymatgen.entries.computed_entries import ComputedStructureEntry
 from pymatgen.io.vasp.inputs import POTCAR_STATS_PATH, UnknownPotcarWarning
-from pymatgen.io.vasp.outputs import Locpot, Outcar, Procar, Vasprun, _parse_vasp_array
+from pymatgen.io.vasp.outputs import BSVasprun, Locpot, Outcar, Procar, Vasprun, _parse_vasp_array
 from pymatgen.util.typing import PathLike, SpeciesLike
+from scipy.spatial import cKDTree
 
 from doped.core import DefectEntry, remove_site_oxi_state
 
+try:
+    from lxml.etree import iterparse
+
+    lxml_installed = True
+except ImportError:
+    from xml.etree.ElementTree import iterparse
+
+    lxml_installed = False
+
+try:  # faster gzip decompression backends, for ``vasprun.xml.gz`` files etc.
+    from isal import igzip as fast_gzip
+
+    fast_gzip_installed = True
+except ImportError:
+    try:
+        from zlib_ng import gzip_ng as fast_gzip
+
+        fast_gzip_installed = True
+    except ImportError:
+        fast_gzip_installed = False
+
 
 @lru_cache(maxsize=1000)  # cache POTCAR generation to speed up generation and writing
 def _get_potcar_summary_stats() -> dict:
@@ -46,6 +70,18 @@ def suppress_logging(level=logging.CRITICAL):
         logging.disable(previous_level)  # restore the original logging level
 
 
+def _open_output_file(path: PathLike):
+    """
+    Open a (possibly compressed) output file for binary reading, using the
+    ``isal`` or ``zlib-ng`` gzip backends (if installed) with a 1 MiB read
+    buffer for ``.gz`` files, which decompress several times faster than the
+    standard library ``gzip`` module, else ``monty`` ``zopen``.
+    """
+    if fast_gzip_installed and str(path).endswith(".gz"):
+        return io.BufferedReader(fast_gzip.open(path, "rb"), buffer_size=1 << 20)
+    return zopen(path, "rb")
+
+
 def find_archived_fname(fname, raise_error=True):
     """
     Find a suitable filename, taking account of possible use of compression
@@ -126,9 +162,16 @@ def parse_projected_eigen(
     return proj_eigen, proj_mag
 
 
-def get_vasprun(vasprun_path: PathLike, parse_mag: bool = True, **kwargs):
+def get_vasprun(
+    vasprun_path: PathLike, parse_mag: bool = True, band_structure_only: bool = False, **kwargs
+):
     """
     Read the ``vasprun.xml(.gz)`` file as a ``pymatgen`` ``Vasprun`` object.
+
+    If ``band_structure_only`` is ``True``, the file is instead parsed as a
+    ``BSVasprun`` object (faster, skipping e.g. the ionic steps and DOS), for
+    when only the eigenvalues/band edges are needed. ``kwargs`` are then passed
+    to ``BSVasprun`` (e.g. ``parse_projected_eigen``).
     """
     vasprun_path = str(vasprun_path)  # convert to string if Path object
     warnings.filterwarnings(
@@ -138,13 +181,18 @@ def get_vasprun(vasprun_path: PathLike, parse_mag: bool = True, **kwargs):
     warnings.filterwarnings(
         "ignore", message="No POTCAR file with matching TITEL fields"
     )  # `message` only needs to match start of message
-    default_kwargs = {"parse_dos": False, "exception_on_bad_xml": False}
+    if band_structure_only:
+        vasprun_class: type[Vasprun] = BSVasprun
+        default_kwargs = {"parse_potcar_file": False}
+    else:
+        vasprun_class = Vasprun
+        default_kwargs = {"parse_dos": False, "exception_on_bad_xml": False}
     default_kwargs.update(kwargs)
 
     Vasprun._parse_projected_eigen = partialmethod(parse_projected_eigen, parse_mag=parse_mag)
     try:
         with warnings.catch_warnings(record=True) as w:
-            vasprun = Vasprun(find_archived_fname(vasprun_path), **default_kwargs)
+            vasprun = vasprun_class(find_archived_fname(vasprun_path), **default_kwargs)
         for warning in w:
             if "XML is malformed" in str(warning.message):
                 warnings.warn(
@@ -162,6 +210,84 @@ def get_vasprun(vasprun_path: PathLike, parse_mag: bool = True, **kwargs):
     return vasprun
 
 
+def get_eigenvalue_band_properties(
+    vasprun_path: PathLike, occu_tol: float = 1e-8
+) -> tuple[float, float, float, bool]:
+    """
+    Get the band gap, CBM, VBM and whether the gap is direct, from the final
+    eigenvalues in a ``vasprun.xml(.gz)`` file, matching
+    ``Vasprun.eigenvalue_band_properties`` (with ``separate_spins=False``).
+
+    Rather than building the full ``Vasprun`` object, the file is streamed
+    with ``iterparse`` (using ``lxml`` if installed), extracting only the
+    eigenvalues and clearing other elements once read, which is much faster
+    and keeps peak memory low for large ``vasprun.xml`` files (e.g. from
+    bandstructure calculations with many `k`-points).
+
+    Args:
+        vasprun_path (PathLike):
+            Path to the ``vasprun.xml(.gz)`` file.
+        occu_tol (float):
+            Occupation tolerance, above which states are considered occupied.
+            Default is 1e-8 (as in ``pymatgen``).
+
+    Returns:
+        tuple[float, float, float, bool]:
+            Band gap, CBM, VBM and whether the band gap is direct.
+    """
+    try:
+        vasprun_path = find_archived_fname(str(vasprun_path))
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(
+            f"vasprun.xml not found at {vasprun_path}(.gz/.xz/.bz/.lzma). Needed for parsing calculation "
+            f"output!"
+        ) from exc
+
+    eigenvalues_and_occus = None
+    projected_depth = 0  # ``<eigenvalues>`` are also nested in ``<projected>`` for some VASP versions
+    with _open_output_file(vasprun_path) as f:
+        for event, elem in iterparse(f, events=("start", "end")):
+            if elem.tag == "projected":
+                projected_depth += 1 if event == "start" else -1
+            if event != "end":
+                continue
+
+            if elem.tag == "eigenvalues" and not projected_depth:
+                eigenvalues_and_occus = np.array(  # shape: (spins, kpoints, bands, 2)
+                    [
+                        [
+                            [r.text.split() for r in kpoint_set.findall("r")]
+                            for kpoint_set in spin_set.findall("set")
+                        ]
+                        for spin_set in elem.find("array").find("set").findall("set")
+                    ],
+                    dtype=float,
+                )
+                elem.clear()
+            elif elem.tag in {"projected", "dos", "calculation", "structure", "varray", "scstep"}:
+                elem.clear()  # free memory from elements not needed here
+
+    if eigenvalues_and_occus is None:
+        raise ValueError(f"No eigenvalues found in {vasprun_path}!")
+
+    eigenvalues, occus = eigenvalues_and_occus[..., 0], eigenvalues_and_occus[..., 1]
+    occupied = occus > occu_tol
+    # as in ``pymatgen``, VBM/CBM are -/+ inf (with no k-point) if no states are (un)occupied:
+    vbm, cbm = -np.inf, np.inf
+    vbm_kpoint = cbm_kpoint = None
+    # first occurrences (in spin, k-point, band order), as with the loop in ``pymatgen``:
+    if occupied.any():
+        vbm_idx = np.where(occupied, eigenvalues, -np.inf).argmax()
+        vbm = float(eigenvalues.ravel()[vbm_idx])
+        vbm_kpoint = np.unravel_index(vbm_idx, eigenvalues.shape)[1]
+    if not occupied.all():
+        cbm_idx = np.where(occupied, np.inf, eigenvalues).argmin()
+        cbm = float(eigenvalues.ravel()[cbm_idx])
+        cbm_kpoint = np.unravel_index(cbm_idx, eigenvalues.shape)[1]
+
+    return max(cbm - vbm, 0), cbm, vbm, bool(vbm_kpoint == cbm_kpoint)
+
+
 def get_locpot(locpot_path: PathLike):
     """
     Read the ``LOCPOT(.gz)`` file as a ``pymatgen`` ``Locpot`` object.
@@ -320,7 +446,7 @@ def get_procar(procar_path: PathLike) -> Procar:
 
 
 def _get_output_files_and_check_if_multiple(
-    output_file: PathLike = "vasprun.xml", path: PathLike = "."
+    output_file: PathLike = "vasprun.xml", path: PathLike = ".", files: Iterable[str] | None = None
 ) -> tuple[PathLike, bool]:
     """
     Search for all files with filenames matching ``output_file``, case-
@@ -332,6 +458,10 @@ def _get_output_files_and_check_if_multiple(
             ``vasprun.xml``, ``OUTCAR``, ``LOCPOT`` or ``PROCAR``.
         path (PathLike):
             The path to the directory to search in.
+        files (Iterable[str]):
+            The filenames in ``path``, if already known (e.g. from a previous
+            scan of the directory), to avoid listing it again. If ``None``
+            (default), ``path`` is listed with ``os.listdir``.
 
     Returns:
         Tuple[PathLike, bool]:
@@ -343,7 +473,8 @@ def _get_output_files_and_check_if_multiple(
     else:
         search_patterns = [output_file.lower()]
 
-    files = os.listdir(path)
+    if files is None:
+        files = os.listdir(path)
     output_files = [
         filename
         for filename in files
@@ -747,14 +878,17 @@ def find_missing_idx(
         if len(frac_coords1) < len(frac_coords2)
         else (frac_coords2, frac_coords1)
     )
-    # in theory this could be made even faster using ``lll_frac_tol`` as in ``_cart_dists()`` in
-    # ``pymatgen``, with smart choice of initial ``lll_frac_tol`` and scanning upwards if the match is
-    # below the threshold tolerance (as in ``StructureMatcher_scan_stol()``), but in practice this
-    # function seems to be incredibly fast as is. Can revisit if it ever becomes a bottleneck
-    _vecs, d_2 = pbc_shortest_vectors(lattice, subset, superset, return_d2=True)
-    site_matches = LinearAssignment(d_2).solution  # matching superset indices, of len(subset)
+    # match sites by their (exact, LLL-reduced minimum image) periodic nearest neighbours with a KD-tree
+    # first (O(N log N)), which is the optimal assignment if one-to-one, otherwise use the full (O(N^3))
+    # linear assignment:
+    _distances, site_matches = _get_periodic_nearest_neighbours(
+        lattice, np.asarray(subset), np.asarray(superset)
+    )
+    if len(np.unique(site_matches)) != len(subset):  # nearest neighbours not one-to-one
+        _vecs, d_2 = pbc_shortest_vectors(lattice, subset, superset, return_d2=True)
+        site_matches = LinearAssignment(d_2).solution  # matching superset indices, of len(subset)
 
-    return next(iter(set(np.arange(len(superset), dtype=int)) - set(site_matches)))
+    return int(np.setdiff1d(np.arange(len(superset)), site_matches)[0])
 
 
 def _create_unrelaxed_defect_structure(
@@ -847,6 +981,56 @@ def get_wigner_seitz_radius(lattice: Structure | Lattice) -> float:
             return max(distances) / 2.0
 
 
+_PBC_IMAGES = np.array(list(itertools.product((-1, 0, 1), repeat=3)))
+
+
+def _get_periodic_nearest_neighbours(
+    lattice: Lattice, subset: np.ndarray, superset: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Get the (periodic) distances from each of the ``subset`` fractional
+    coordinates to their nearest neighbours in ``superset``, and the indices of
+    these nearest neighbours in ``superset``, using a KD-tree (O(N log N)) of
+    the Cartesian coordinates of ``superset`` and its neighbouring periodic
+    images.
+
+    As in ``pbc_shortest_vectors``, the coordinates are first converted to the
+    LLL-reduced lattice, for which the 27 neighbouring images (including the
+    unit cell) contain the minimum image, unlike for skewed (non-reduced)
+    cells.
+    """
+    lll_lattice = lattice.get_lll_reduced_lattice()
+    # wrap to the (LLL-reduced) unit cell, for the 27 images:
+    subset = np.mod(lattice.get_lll_frac_coords(subset), 1)
+    superset = np.mod(lattice.get_lll_frac_coords(superset), 1)
+    superset_images = (superset[:, None, :] + _PBC_IMAGES[None, :, :]).reshape(-1, 3)
+    tree = cKDTree(lll_lattice.get_cartesian_coords(superset_images))
+    distances, nn_image_idxs = tree.query(lll_lattice.get_cartesian_coords(subset), k=1)
+
+    return distances, nn_image_idxs // len(_PBC_IMAGES)
+
+
+def _get_nearest_neighbour_displacements_if_unique(
+    lattice: Lattice, subset: np.ndarray, superset: np.ndarray
+) -> np.ndarray | None:
+    """
+    Get the (periodic) displacements from each of the ``subset`` fractional
+    coordinates to their nearest neighbours in ``superset``, using a KD-tree
+    (O(N log N)).
+
+    If the nearest neighbours are unique (i.e. a one-to-one mapping, as is the
+    case for matching bulk and defect supercells), then this mapping minimises
+    each displacement individually and so is also the optimal linear assignment
+    (and these displacements are returned). Otherwise, returns ``None``, and the
+    full linear assignment is required.
+    """
+    displacements, nn_idxs = _get_periodic_nearest_neighbours(lattice, subset, superset)
+    if len(np.unique(nn_idxs)) != len(subset):
+        return None
+
+    return displacements
+
+
 def check_atom_mapping_far_from_defect(
     bulk_supercell: Structure,
     defect_supercell: Structure,
@@ -936,10 +1120,14 @@ def check_atom_mapping_far_from_defect(
             if len(defect_species_outside_ws_coords) < len(bulk_species_outside_near_ws_coords)
             else (bulk_species_outside_near_ws_coords, defect_species_outside_ws_coords)
         )
-        vecs, d_2 = pbc_shortest_vectors(bulk_supercell.lattice, subset, superset, return_d2=True)
-        site_matches = LinearAssignment(d_2).solution  # matching superset indices, of len(subset)
-        matching_vecs = vecs[np.arange(len(site_matches)), site_matches]
-        displacements = np.linalg.norm(matching_vecs, axis=1)
+        displacements = _get_nearest_neighbour_displacements_if_unique(
+            bulk_supercell.lattice, subset, superset
+        )
+        if displacements is None:  # nearest neighbours not one-to-one, use full linear assignment
+            vecs, d_2 = pbc_shortest_vectors(bulk_supercell.lattice, subset, superset, return_d2=True)
+            site_matches = LinearAssignment(d_2).solution  # matching superset indices, of len(subset)
+            matching_vecs = vecs[np.arange(len(site_matches)), site_matches]
+            displacements = np.linalg.norm(matching_vecs, axis=1)
         far_from_defect_disps[species.name].extend(
             np.round(displacements[displacements > displacement_tol], 2)
         )
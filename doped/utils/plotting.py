@@ -261,6 +261,17 @@ def _set_title_and_save_figure(ax, fig, title, chempot_table, filename, styled_f
         )
 
 
+# precompiled (case-insensitive) regexes for site info in defect names, for each possible site info
+# preposition ("s", "m", "mult" or none) and postposition (lowercase letter or none);
+# ([a-z_]+) -> 1st group; matches any letters or underscores (no numbers)
+# ({site_preposition}[0-9]+{site_postposition}) -> 2nd group; pre, number(s), post
+_SITE_INFO_REGEXES = tuple(
+    re.compile(f"([a-z_]+)({site_preposition}[0-9]+{site_postposition})", re.I)
+    for site_preposition in ["s", "m", "mult", ""]
+    for site_postposition in [r"[a-z]", ""]
+)
+
+
 def format_defect_name(
     defect_species: str,
     include_site_info_in_name: bool = False,
@@ -464,47 +475,39 @@ def format_defect_name(
                 the format matches, and the second element is the site
                 information (if applicable) or ``None``.
         """
-        for site_preposition in ["s", "m", "mult", ""]:  # possible site into prepositions
-            for site_postposition in [r"[a-z]", ""]:  # possible site info postpositions
-                match = re.match(
-                    # ([a-z_]+) -> 1st group; matches any letters or underscores (no numbers)
-                    # ({site_preposition}[0-9]+{site_postposition}) -> 2nd group; pre, number(s), post
-                    f"([a-z_]+)({site_preposition}[0-9]+{site_postposition})",
-                    name,
-                    re.I,  # case-insensitive match
-                )
-
-                if match:
-                    items = match.groups()
-                    for match_generator in [
-                        (
-                            fstring in name
-                            for pre_def_type in pre_def_type_list
-                            for fstring in [
-                                f"{pre_def_type}{items[1]}{element}",
-                                f"{pre_def_type}{element}{items[1]}",
-                                f"{pre_def_type}{items[1]}_{element}",
-                                f"{pre_def_type}{element}_{items[1]}",
-                            ]
-                        ),
-                    ]:
-                        if any(match_generator):
-                            return True, items[1].replace("mult", "m")
-
-                    for match_generator in [
-                        (
-                            fstring in name
-                            for post_def_type in post_def_type_list
-                            for fstring in [
-                                f"{element}{items[1]}{post_def_type}",
-                                f"{items[1]}{element}{post_def_type}",
-                                f"{element}{items[1]}_{post_def_type}",
-                                f"{items[1]}_{element}{post_def_type}",
-                            ]
-                        ),
-                    ]:
-                        if any(match_generator):
-                            return True, items[1].replace("mult", "m")
+        for site_info_regex in _SITE_INFO_REGEXES:
+            match = site_info_regex.match(name)
+            if match:
+                items = match.groups()
+                for match_generator in [
+                    (
+                        fstring in name
+                        for pre_def_type in pre_def_type_list
+                        for fstring in [
+                            f"{pre_def_type}{items[1]}{element}",
+                            f"{pre_def_type}{element}{items[1]}",
+                            f"{pre_def_type}{items[1]}_{element}",
+                            f"{pre_def_type}{element}_{items[1]}",
+                        ]
+                    ),
+                ]:
+                    if any(match_generator):
+                        return True, items[1].replace("mult", "m")
+
+                for match_generator in [
+                    (
+                        fstring in name
+                        for post_def_type in post_def_type_list
+                        for fstring in [
+                            f"{element}{items[1]}{post_def_type}",
+                            f"{items[1]}{element}{post_def_type}",
+                            f"{element}{items[1]}_{post_def_type}",
+                            f"{items[1]}_{element}{post_def_type}",
+                        ]
+                    ),
+                ]:
+                    if any(match_generator):
+                        return True, items[1].replace("mult", "m")
 
         return False, None
 
@@ -601,32 +604,24 @@ def format_defect_name(
         if (
             defect_name and include_site_info_in_name
         ):  # if we have a match, check if we can add the site number
-            for site_preposition in ["s", "m", "mult", ""]:  # old site info formats
-                for site_postposition in [r"[a-z]", ""]:
-                    match = re.match(
-                        # ([a-z_]+) -> 1st group; matches any letters or underscores (no numbers)
-                        # ({site_preposition}[0-9]+{site_postposition}) -> 2nd group; pre, number(s), post
-                        f"([a-z_]+)({site_preposition}[0-9]+{site_postposition})",
-                        name,
-                        re.I,  # case-insensitive match
-                    )
-
-                    if match:
-                        items = match.groups()
-                        if any(
-                            fstring in name
-                            for fstring in [
-                                f"{items[1]}_{substituting_element}_{orig_site_element}",
-                                f"{substituting_element}_{orig_site_element}_{items[1]}",
-                                f"{items[1]}_{substituting_element}_on_{orig_site_element}",
-                                f"{substituting_element}_on_{orig_site_element}_{items[1]}",
-                            ]
-                        ):
-                            defect_name = (
-                                f"{substituting_element}$_{{{orig_site_element}_{{{items[1]}}}}}^"
-                                f"{{{charge_string}}}$"
-                            )
-                            return defect_name.replace("mult", "m")
+            for site_info_regex in _SITE_INFO_REGEXES:  # old site info formats
+                match = site_info_regex.match(name)
+                if match:
+                    items = match.groups()
+                    if any(
+                        fstring in name
+                        for fstring in [
+                            f"{items[1]}_{substituting_element}_{orig_site_element}",
+                            f"{substituting_element}_{orig_site_element}_{items[1]}",
+                            f"{items[1]}_{substituting_element}_on_{orig_site_element}",
+                            f"{substituting_element}_on_{orig_site_element}_{items[1]}",
+                        ]
+                    ):
+                        defect_name = (
+                            f"{substituting_element}$_{{{orig_site_element}_{{{items[1]}}}}}^"
+                            f"{{{charge_string}}}$"
+                        )
+                        return defect_name.replace("mult", "m")
 
         if defect_name:
             defect_name = defect_name.replace("mult", "m")
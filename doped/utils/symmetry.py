@@ -32,7 +32,7 @@ from sympy import Eq, simplify, solve, symbols
 from tqdm import tqdm
 
 from doped.core import Defect, DefectEntry
-from doped.utils.efficiency import PeriodicSite, SpacegroupAnalyzer, Structure
+from doped.utils.efficiency import PeriodicSite, SpacegroupAnalyzer, Structure, _structure_fingerprint
 from doped.utils.parsing import (
     _get_bulk_supercell,
     _get_defect_supercell,
@@ -239,6 +239,36 @@ def _frac_coords_sort_func(coords):
     return (-num_equals, magnitude, *np.abs(coords_for_sorting))
 
 
+def _array_custom_round(array: np.ndarray, decimals: int = 3) -> np.ndarray:
+    """
+    Array version of ``_custom_round``, with ``numpy`` rounding.
+    """
+    rounded_array = np.round(array, decimals)
+    return np.where(
+        np.abs(rounded_array - array) < 0.15 * float(10) ** (-decimals),
+        rounded_array,
+        np.round(array, decimals + 1),
+    )
+
+
+def _frac_coords_sort_order(frac_coords: np.ndarray) -> np.ndarray:
+    """
+    Get the indices which sort an ``(N, 3)`` array of fractional coordinates in
+    the same order as ``sorted(frac_coords, key=_frac_coords_sort_func)``, but
+    vectorised (with ``np.lexsort``) rather than calling the sort function on
+    each set of coordinates.
+    """
+    coords_for_sorting = _array_custom_round(np.mod(_array_custom_round(np.asarray(frac_coords)), 1))
+    num_equals = sum(
+        np.isclose(coords_for_sorting[:, i], coords_for_sorting[:, j], atol=1e-3)
+        for i, j in ((0, 1), (0, 2), (1, 2))
+    )
+    magnitudes = _array_custom_round(np.linalg.norm(coords_for_sorting, axis=1))
+    abs_coords = np.abs(coords_for_sorting)
+    # keys in reverse order of priority for ``np.lexsort``:
+    return np.lexsort((abs_coords[:, 2], abs_coords[:, 1], abs_coords[:, 0], magnitudes, -num_equals))
+
+
 def get_sga(struct: Structure, symprec: float = 0.01) -> SpacegroupAnalyzer:
     """
     Get a ``SpacegroupAnalyzer`` object of the input structure, dynamically
@@ -335,6 +365,28 @@ def _cache_ready_get_sga(
     )
 
 
+@lru_cache(maxsize=int(1e3))
+def _get_frac_symm_op_arrays(
+    structure: Structure, symprec: float = 0.01
+) -> tuple[np.ndarray, np.ndarray, float]:
+    """
+    Get the (fractional) symmetry operations of ``structure``, as stacked
+    arrays of rotation matrices (``(N, 3, 3)``) and translation vectors
+    (``(N, 3)``), along with the final ``symprec`` used for
+    ``SpacegroupAnalyzer`` initialisation (see ``get_sga_and_symprec``).
+
+    Cached, so that the symmetry operations of a given (e.g. bulk supercell)
+    structure are only determined once, and then applied to the coordinates
+    of each new (e.g. defect) site with array operations.
+    """
+    sga, symprec = get_sga_and_symprec(structure, symprec=symprec)
+    symm_ops = sga.get_symmetry_operations()  # fractional symm_ops by default
+    rotations = np.array([symm_op.rotation_matrix for symm_op in symm_ops], dtype=float)
+    translations = np.array([symm_op.translation_vector for symm_op in symm_ops], dtype=float)
+    rotations.flags.writeable = translations.flags.writeable = False  # shared between cache calls
+    return rotations, translations, symprec
+
+
 def apply_symm_op_to_site(
     symm_op: SymmOp,
     site: PeriodicSite,
@@ -846,23 +898,27 @@ def _raw_get_all_equiv_sites(
         just_frac_coords: bool = False,
     ):
         dist_tol = dist_tol_factor * symprec  # distance tolerance for clustering sites
-        sga, symprec = get_sga_and_symprec(structure, symprec=symprec)
-        symm_ops = sga.get_symmetry_operations()  # fractional symm_ops by default
+        rotations, translations, symprec = _get_frac_symm_op_arrays(structure, symprec=symprec)
 
+        # apply all (fractional) symm_ops at once, and translate to the unit cell:
         dummy_site = PeriodicSite(species, frac_coords, structure.lattice, properties=properties)
-        x_sites = [
-            apply_symm_op_to_site(
-                symm_op,
-                dummy_site,
-                fractional=True,
-                rotate_lattice=structure.lattice,  # same lattice, just want transformed frac coords
-                just_unit_cell_frac_coords=just_frac_coords,
-            )
-            for symm_op in symm_ops
-        ]
-        if not just_frac_coords:
-            for site in x_sites:
-                site.to_unit_cell(in_place=True)  # faster with in_place
+        x_frac_coords = np.einsum("ijk,k->ij", rotations, dummy_site.frac_coords) + translations
+        pbc = np.array(structure.lattice.pbc, dtype=bool)
+        x_frac_coords[:, pbc] = np.mod(x_frac_coords[:, pbc], 1)
+        if just_frac_coords:
+            x_sites = list(x_frac_coords)
+        else:
+            x_sites = [
+                PeriodicSite(
+                    dummy_site.species,
+                    x_frac_coord,
+                    structure.lattice,
+                    properties=dummy_site.properties,
+                    skip_checks=True,
+                    label=dummy_site._label,
+                )
+                for x_frac_coord in x_frac_coords
+            ]
 
         return cluster_sites_by_dist_tol(x_sites, structure, dist_tol=dist_tol)
 
@@ -1990,13 +2046,30 @@ def get_primitive_structure(
     cache_ready_ignored_species = tuple(ignored_species) if ignored_species is not None else None
     cache_ready_kwargs = tuple(kwargs.items()) if kwargs else None
 
-    return _cache_ready_get_primitive_structure(
-        structure,
-        ignored_species=cache_ready_ignored_species,
-        clean=clean,
-        return_all=return_all,
-        kwargs=cache_ready_kwargs,
+    # check the cheap structure fingerprint cache first, as the same (bulk) supercell is typically used
+    # for many defects when parsing, and hashing/comparing full ``Structure`` objects is comparatively slow:
+    cache_key = (
+        _structure_fingerprint(structure),
+        cache_ready_ignored_species,
+        clean,
+        return_all,
+        cache_ready_kwargs,
     )
+    if cache_key not in _primitive_structure_cache:
+        if len(_primitive_structure_cache) >= 1000:  # limit cache size, dropping the oldest entry
+            _primitive_structure_cache.pop(next(iter(_primitive_structure_cache)))
+        _primitive_structure_cache[cache_key] = _cache_ready_get_primitive_structure(
+            structure,
+            ignored_species=cache_ready_ignored_species,
+            clean=clean,
+            return_all=return_all,
+            kwargs=cache_ready_kwargs,
+        )
+
+    return _primitive_structure_cache[cache_key]
+
+
+_primitive_structure_cache: dict[tuple, Structure | list[Structure]] = {}
 
 
 @lru_cache(maxsize=int(1e3))
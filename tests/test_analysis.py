@@ -16,6 +16,7 @@ import numpy as np
 import pytest
 from monty.serialization import dumpfn, loadfn
 from pymatgen.analysis.defects.core import DefectType
+from pymatgen.core.lattice import Lattice
 from pymatgen.core.structure import Structure
 from pymatgen.electronic_structure.dos import FermiDos
 from test_thermodynamics import custom_mpl_image_compare
@@ -23,6 +24,7 @@ from test_thermodynamics import custom_mpl_image_compare
 from doped.analysis import (
     DefectParser,
     DefectsParser,
+    defect_entries_from_paths,
     defect_entry_from_paths,
     defect_from_structures,
     defect_name_from_structures,
@@ -32,10 +34,13 @@ from doped.generation import DefectsGenerator, get_defect_name_from_defect, get_
 from doped.utils.eigenvalues import get_eigenvalue_analysis
 from doped.utils.parsing import (
     Vasprun,
+    _get_periodic_nearest_neighbours,
     _num_electrons_from_charge_state,
     _simple_spin_degeneracy_from_num_electrons,
+    find_missing_idx,
     get_defect_type_and_composition_diff,
     get_defect_type_site_idxs_and_unrelaxed_structure,
+    get_eigenvalue_band_properties,
     get_magnetization_from_vasprun,
     get_outcar,
     get_procar,
@@ -1564,6 +1569,27 @@ class DefectsParsingTestCase(unittest.TestCase):
             atol=1e-2,
         )
 
+    def test_defect_entries_from_paths(self):
+        # batch parsing should match individual ``defect_entry_from_paths`` parsing:
+        defect_paths = [f"{self.CdTe_EXAMPLE_DIR}/{name}/vasp_ncl" for name in ["v_Cd_-2", "v_Cd_0"]]
+        defect_entries = defect_entries_from_paths(
+            defect_paths,
+            bulk_path=self.CdTe_BULK_DATA_DIR,
+            dielectric=self.CdTe_dielectric,
+            parse_projected_eigen=False,  # just for fast testing, not recommended in general!
+        )
+        assert len(defect_entries) == 2
+        for defect_path, defect_entry in zip(defect_paths, defect_entries):
+            single_defect_entry = defect_entry_from_paths(
+                defect_path,
+                bulk_path=self.CdTe_BULK_DATA_DIR,
+                dielectric=self.CdTe_dielectric,
+                parse_projected_eigen=False,
+            )
+            assert defect_entry.name == single_defect_entry.name
+            assert defect_entry.charge_state == single_defect_entry.charge_state
+            assert np.isclose(defect_entry.get_ediff(), single_defect_entry.get_ediff())
+
     def test_auto_charge_correction_behaviour(self):
         """
         Test skipping of charge corrections and warnings.
@@ -3401,6 +3427,42 @@ class DefectsParsingTestCase(unittest.TestCase):
     #         )
     #         assert np.isclose(orientational_degeneracy, 0.25, atol=1e-2)
 
+    def test_get_eigenvalue_band_properties(self):
+        # streamed band edges should match those from the full ``Vasprun`` object:
+        for vr_path in [
+            f"{self.CdTe_BULK_DATA_DIR}/vasprun.xml.gz",  # NCL
+            f"{self.data_dir}/Magnetization_Tests/O2_mmm_EaH_0/vasp_std/vasprun.xml.gz",  # ISPIN = 2
+        ]:
+            vr = get_vasprun(vr_path)
+            assert np.allclose(
+                get_eigenvalue_band_properties(vr_path)[:3], vr.eigenvalue_band_properties[:3]
+            )
+            assert get_eigenvalue_band_properties(vr_path)[3] == vr.eigenvalue_band_properties[3]
+
+    def test_periodic_nearest_neighbours_skewed_cell(self):
+        # KD-tree nearest neighbours should match the exact minimum image distances, including for
+        # skewed (non-LLL-reduced) cells where the 27 neighbouring images of the unreduced cell
+        # don't always contain the minimum image:
+        lattice = Lattice([[5, 0, 0], [12, 5, 0], [3, 9, 6]])
+        rng = np.random.default_rng(42)
+        subset, superset = rng.random((200, 3)), rng.random((3, 3))  # sparse superset, so far NNs
+        distances, nn_idxs = _get_periodic_nearest_neighbours(lattice, subset, superset)
+        all_distances = lattice.get_all_distances(subset, superset)
+        assert np.allclose(distances, all_distances.min(axis=1))
+        assert np.allclose(all_distances[np.arange(len(subset)), nn_idxs], distances)
+
+    def test_find_missing_idx_skewed_cell(self):
+        # the missing site should be correctly identified with the fast nearest-neighbour matching,
+        # including for skewed (non-LLL-reduced) cells and periodic images of the matching sites:
+        lattice = Lattice([[5, 0, 0], [12, 5, 0], [3, 9, 6]])
+        rng = np.random.default_rng(42)
+        superset = rng.random((30, 3))
+        for missing_idx in [0, 13, 29]:
+            subset = np.delete(superset, missing_idx, axis=0)
+            subset += rng.integers(-2, 3, subset.shape) + rng.normal(0, 0.002, subset.shape)
+            assert find_missing_idx(subset, superset, lattice) == missing_idx
+            assert find_missing_idx(superset, subset, lattice) == missing_idx
+
     def test_magnetization_parsing(self):
         # individual checks first:
         # bulk NCL:
@@ -385,6 +385,26 @@ class DefectPlottingTestCase(unittest.TestCase):
             )
             assert formatted_name == expected_name
 
+    def test_format_defect_name_old_site_info(self):
+        """
+        Test ``format_defect_name`` with each of the old site info formats
+        (``s``, ``m``/``mult`` or bare site numbers, with or without a letter
+        postposition), with and without site info in the formatted name.
+        """
+        for defect_species, (expected_name_w_site_info, expected_name) in {
+            "Te_Cd_s32c_2": ("Te$_{Cd_{s32c}}^{+2}$", "Te$_{Cd}^{+2}$"),
+            "Te_Cd_s32_2": ("Te$_{Cd_{s32}}^{+2}$", "Te$_{Cd}^{+2}$"),
+            "vac_Cd_mult32_0": ("$\\it{V}\\!$ $_{Cd_{m32}}^{0}$", "$\\it{V}\\!$ $_{Cd}^{0}$"),
+            "Sub_Li_on_Ni_mult32_-1": ("Li$_{Ni_{m32}}^{-1}$", "Li$_{Ni}^{-1}$"),
+            "inter_14_O_+2": ("O$_{i_{14}}^{+2}$", "O$_i^{+2}$"),
+            "vac_14_Th_+2": ("$\\it{V}\\!$ $_{Th_{14}}^{+2}$", "$\\it{V}\\!$ $_{Th}^{+2}$"),
+        }.items():
+            assert (
+                plotting.format_defect_name(defect_species, include_site_info_in_name=True)
+                == expected_name_w_site_info
+            )
+            assert plotting.format_defect_name(defect_species) == expected_name
+
     @custom_mpl_image_compare(filename="neutral_v_O_plot.png")
     def test_plot_neutral_v_O_V2O5(self):
         """
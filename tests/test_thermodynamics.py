@@ -28,7 +28,7 @@ from monty.serialization import dumpfn, loadfn
 from pymatgen.core.composition import Composition
 from pymatgen.electronic_structure.dos import FermiDos
 
-from doped.analysis import DefectsParser, guess_defect_position
+from doped.analysis import DefectsParser, guess_defect_position, guess_defect_positions
 from doped.generation import sort_defect_entries
 from doped.thermodynamics import (
     DefectThermodynamics,
@@ -808,6 +808,14 @@ class DefectThermodynamicsTestCase(DefectThermodynamicsSetupMixin):
         first_entry = next(iter(defect_thermo.defect_entries.values()))
         assert np.mean(guessed_def_pos_deviations) < np.max(first_entry.bulk_supercell.lattice.abc) * 0.2
 
+        # batched guessing matches individual guessing (serial and multiprocessing):
+        defect_supercells = [entry.defect_supercell for entry in defect_thermo.defect_entries.values()]
+        for processes in [1, 2]:
+            assert np.allclose(
+                guess_defect_positions(defect_supercells, processes=processes),
+                [guess_defect_position(defect_supercell) for defect_supercell in defect_supercells],
+            )
+
         print("Checking dict attributes passed to defect_entries successfully")
         assert len(defect_thermo) == len(defect_thermo.defect_entries)  # __len__()
         assert dict(defect_thermo.items()) == defect_thermo.defect_entries  # __iter__()
@@ -2806,6 +2814,30 @@ class DefectThermodynamicsTestCase(DefectThermodynamicsSetupMixin):
             atol=1e-3,
         )
 
+        # batched windows, for all entries at once:
+        stability_windows = self.CdTe_defect_thermo._get_in_gap_fermi_level_stability_windows()
+        assert set(stability_windows) == {
+            defect_entry.name for defect_entry in self.CdTe_defect_thermo.defect_entries.values()
+        }
+        for defect_name, stability_window in [
+            ("v_Cd_0", 0.47),
+            ("v_Cd_-1", -np.inf),  # unstable
+            ("v_Cd_-2", 1.028),
+            ("Te_Cd_+1", np.inf),
+            ("Int_Te_3_Unperturbed_1", 1.4092),
+            ("Int_Te_3_1", np.inf),
+            ("Int_Te_3_2", 0.08967),
+        ]:
+            assert np.isclose(stability_windows[defect_name], stability_window, atol=1e-2)
+
+        # and for a subset of entries:
+        stability_windows = self.CdTe_defect_thermo._get_in_gap_fermi_level_stability_windows(
+            [self.CdTe_defect_thermo.defect_entries[name] for name in ["v_Cd_-1", "v_Cd_-2"]]
+        )
+        assert set(stability_windows) == {"v_Cd_-1", "v_Cd_-2"}
+        assert stability_windows["v_Cd_-1"] == -np.inf
+        assert np.isclose(stability_windows["v_Cd_-2"], 1.028, atol=1e-2)
+
     def test_is_shallow(self):
         from doped.core import is_shallow
 